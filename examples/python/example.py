@@ -1,8 +1,11 @@
 import sys
 import json
 import time
+from array import array
 import statistics
 import gc
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from zx12 import ZX12, ZX12Error
 
 # Try to import psutil for memory tracking
@@ -14,6 +17,14 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     print("Note: Install 'psutil' for memory usage tracking: pip install psutil\n")
 
+# Use numpy for benchmark statistics when available
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
     """
@@ -34,7 +45,8 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
     print(f"Iterations: {iterations:,}")
     print(f"{'=' * 60}\n")
 
-    times = []
+    # Preallocate the per-iteration timings (seconds) so the loop never grows a list
+    times = array("d", [0.0]) * iterations if track_times else array("d")
     memory_samples = []
 
     # Get process for memory tracking
@@ -47,7 +59,7 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
 
     # Load schema once for all iterations
     print("Loading schema... ", end="", flush=True)
-    with zx12.load_schema(schema_file) as schema:
+    with zx12.load_schema(schema_file) as schema, zx12.create_context() as context:
         print("Done!")
 
         if PSUTIL_AVAILABLE:
@@ -57,9 +69,13 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
                 f"Memory after schema load: {schema_loaded_memory:.2f} MB (+{schema_loaded_memory - initial_memory:.2f} MB)\n"
             )
 
-        # Warmup run (not counted)
+        # Every iteration parses into the context's arena, which is reset after
+        # each call and keeps its memory, so the loop does no per-call heap work
+        process_file = zx12.compile_for(schema, context=context)
+
+        # Warmup run (not counted), which also grows the arena to its working size
         print("Warming up... ", end="", flush=True)
-        _ = zx12.process_file_with_schema(x12_file, schema)
+        _ = process_file(x12_file)
         print("Done!")
 
         if PSUTIL_AVAILABLE:
@@ -73,23 +89,30 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
         print(f"Running {iterations:,} iterations... ", end="", flush=True)
         sample_interval = max(1, iterations // 20)  # Sample memory ~20 times during run
 
+        # Bind hot-loop callables to locals to skip attribute lookups per iteration
+        memory_info = process.memory_info if PSUTIL_AVAILABLE else None
+        perf_counter = time.perf_counter
+        x12_path = x12_file.encode("utf-8")  # Encode the path once, not per call
+
         start_time = time.perf_counter()
-        for i in range(iterations):
-            if track_times:
-                start = time.perf_counter()
-            _ = zx12.process_file_with_schema(x12_file, schema)
-            if track_times:
-                end = time.perf_counter()
-                times.append((end - start) * 1000)  # Convert to milliseconds
+        for chunk_start in range(0, iterations, sample_interval):
+            # Memory sampling once per chunk, keeping the check out of the inner loop
+            if memory_info is not None:
+                memory_samples.append(memory_info().rss / 1024 / 1024)
 
-            # Memory sampling
-            if PSUTIL_AVAILABLE and i % sample_interval == 0:
-                current_memory = process.memory_info().rss / 1024 / 1024
-                memory_samples.append(current_memory)
+            chunk_end = min(chunk_start + sample_interval, iterations)
+            # Separate loops so neither checks track_times on every iteration
+            if track_times:
+                for i in range(chunk_start, chunk_end):
+                    start = perf_counter()
+                    process_file(x12_path)
+                    times[i] = perf_counter() - start  # Converted to ms after the run
+            else:
+                for _ in range(chunk_start, chunk_end):
+                    process_file(x12_path)
 
-            # Progress indicator every 1000 iterations
-            if (i + 1) % 1000 == 0:
-                print(f"{i + 1:,}...", end="", flush=True)
+            # Progress indicator once per chunk, outside the timed inner loop
+            print(f"{chunk_end:,}...", end="", flush=True)
 
         end_time = time.perf_counter()
         print(" Done!\n")
@@ -101,18 +124,31 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
 
     # Calculate statistics
     if track_times and times:
-        mean = statistics.mean(times)
-        median = statistics.median(times)
-        stdev = statistics.stdev(times) if len(times) > 1 else 0
-        min_time = min(times)
-        max_time = max(times)
-        total_time = sum(times)
-
-        # Calculate percentiles
-        sorted_times = sorted(times)
-        p50 = sorted_times[len(sorted_times) * 50 // 100]
-        p95 = sorted_times[len(sorted_times) * 95 // 100]
-        p99 = sorted_times[len(sorted_times) * 99 // 100]
+        if NUMPY_AVAILABLE:
+            # View the array's buffer directly, then seconds to milliseconds
+            samples = np.frombuffer(times, dtype=np.float64) * 1000
+            mean = float(samples.mean())
+            stdev = float(samples.std(ddof=1)) if len(samples) > 1 else 0
+            # One partition pass for the median and all percentiles
+            median, p95, p99 = (float(p) for p in np.percentile(samples, [50, 95, 99]))
+            p50 = median
+            min_time = float(samples.min())
+            max_time = float(samples.max())
+            total_time = float(samples.sum())
+        else:
+            samples = [t * 1000 for t in times]  # Seconds to milliseconds
+            mean = statistics.mean(samples)
+            median = statistics.median(samples)
+            stdev = statistics.stdev(samples) if len(samples) > 1 else 0
+
+            # Calculate percentiles
+            sorted_times = sorted(samples)
+            p50 = sorted_times[len(sorted_times) * 50 // 100]
+            p95 = sorted_times[len(sorted_times) * 95 // 100]
+            p99 = sorted_times[len(sorted_times) * 99 // 100]
+            min_time = sorted_times[0]
+            max_time = sorted_times[-1]
+            total_time = sum(samples)
 
         # Print results
         print(f"{'=' * 60}")
@@ -169,28 +205,17 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
         print(f"Peak memory:      {max(memory_samples):>12.2f} MB")
         print(f"Memory delta:     {final_memory - initial_memory:>12.2f} MB")
 
-        # Estimate expected memory from times list
         if track_times:
-            expected_times_memory = (
-                (iterations * 32) / 1024 / 1024
-            )  # ~32 bytes per float with overhead
+            times_memory = times.itemsize * iterations / 1024 / 1024
             print(
-                f"Expected (times): {expected_times_memory:>12.2f} MB (estimated for {iterations:,} floats)"
+                f"Times array:      {times_memory:>12.2f} MB (preallocated for {iterations:,} samples)"
             )
         print(f"{'=' * 60}")
 
-        # Check for potential memory leak
+        # Check for potential memory leak (the times array predates the warmup
+        # measurement, so it does not count as growth)
         memory_growth = final_memory - warmup_memory
 
-        # Adjust for expected times list memory
-        if track_times:
-            adjusted_growth = memory_growth - expected_times_memory
-            print(f"Memory growth:    {memory_growth:>12.2f} MB")
-            print(
-                f"Adjusted growth:  {adjusted_growth:>12.2f} MB (excluding times list)"
-            )
-            memory_growth = adjusted_growth
-
         if abs(memory_growth) < 1.0:  # Less than 1 MB growth
             print(f"✓ No significant memory leak detected")
         elif memory_growth > 0:
@@ -198,12 +223,18 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
             print(
                 f"⚠ Memory increased by {memory_growth:.2f} MB (~{growth_per_iteration:.2f} KB/iteration)"
             )
-            if track_times:
-                print(
-                    f"  Note: Run with --no-timing to exclude times list from analysis"
-                )
+            print(
+                f"  Note: parsing reuses the context's arena, but each result is decoded into"
+            )
+            print(
+                f"  new Python objects, and the interpreter keeps up to ~1.5 MB of freed memory"
+            )
+            print(
+                f"  for reuse; growth of that size that does not scale with --iterations is"
+            )
+            print(f"  expected and is not a leak")
         else:
-            print(f"✓ Memory decreased/stable (adjusted: {memory_growth:.2f} MB)")
+            print(f"✓ Memory decreased/stable ({memory_growth:.2f} MB)")
         print(f"{'=' * 60}")
     else:
         print(f"MEMORY TRACKING")
@@ -215,6 +246,153 @@ def benchmark(zx12, x12_file, schema_file, iterations=10000, track_times=True):
     print()
 
 
+def benchmark_threads(zx12, x12_file, schema_file, iterations=10000, threads=4):
+    """
+    Benchmark aggregate throughput with several threads sharing one schema
+
+    The native parse runs with the GIL released, so parses on separate
+    threads overlap. Each thread uses its own ZX12 instance.
+
+    Args:
+        zx12: ZX12 instance
+        x12_file: Path to X12 file
+        schema_file: Path to schema file
+        iterations: Total number of iterations across all threads
+        threads: Number of worker threads
+    """
+    print(f"\n{'=' * 60}")
+    print(f"THREADED BENCHMARK")
+    print(f"{'=' * 60}")
+    print(f"File: {x12_file}")
+    print(f"Schema: {schema_file}")
+    print(f"Iterations: {iterations:,}")
+    print(f"Threads: {threads}")
+    print(f"{'=' * 60}\n")
+
+    # Split the iterations as evenly as possible across the threads
+    counts = [
+        iterations // threads + (1 if i < iterations % threads else 0)
+        for i in range(threads)
+    ]
+    instances = [ZX12() for _ in range(threads)]
+
+    with zx12.load_schema(schema_file) as schema:
+
+        x12_path = x12_file.encode("utf-8")
+
+        def worker(instance, count):
+            process_file = instance.process_file_with_schema
+            for _ in range(count):
+                process_file(x12_path, schema)
+
+        # Warmup run (not counted)
+        print("Warming up... ", end="", flush=True)
+        _ = zx12.process_file_with_schema(x12_file, schema)
+        print("Done!")
+
+        print(f"Running {iterations:,} iterations... ", end="", flush=True)
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [
+                pool.submit(worker, instance, count)
+                for instance, count in zip(instances, counts)
+            ]
+            for future in futures:
+                future.result()
+        end_time = time.perf_counter()
+        print("Done!\n")
+
+    total_elapsed = (end_time - start_time) * 1000  # Convert to ms
+    print(f"{'=' * 60}")
+    print(f"RESULTS")
+    print(f"{'=' * 60}")
+    print(
+        f"Total time:       {total_elapsed:>12.2f} ms ({total_elapsed / 1000:.2f} seconds)"
+    )
+    print(f"{'=' * 60}")
+    print(f"THROUGHPUT")
+    print(f"{'=' * 60}")
+    print(f"Parses/second:    {iterations / total_elapsed * 1000:>12.2f}")
+    print(f"Parses/minute:    {iterations / total_elapsed * 60000:>12.2f}")
+    print(f"{'=' * 60}")
+    print()
+
+
+# Per-process state for benchmark_processes workers, set up by _init_worker
+_worker_zx12 = None
+_worker_schema = None
+_worker_x12_path = None
+
+
+def _init_worker(x12_file, schema_file):
+    """Give a benchmark worker process its own library instance and schema"""
+    global _worker_zx12, _worker_schema, _worker_x12_path
+    _worker_zx12 = ZX12()
+    _worker_schema = _worker_zx12.load_schema(schema_file)
+    _worker_x12_path = x12_file.encode("utf-8")
+
+
+def _parse_one(_):
+    """Parse the benchmark file once in a worker process"""
+    # Return nothing so the result is not pickled back to the parent
+    _worker_zx12.process_file_with_schema(_worker_x12_path, _worker_schema)
+
+
+def benchmark_processes(x12_file, schema_file, iterations=10000, processes=4):
+    """
+    Benchmark aggregate throughput with a pool of worker processes
+
+    Each worker loads its own library instance and schema once, in the
+    pool initializer, and then parses its share of the iterations.
+
+    Args:
+        x12_file: Path to X12 file
+        schema_file: Path to schema file
+        iterations: Total number of iterations across all processes
+        processes: Number of worker processes
+    """
+    print(f"\n{'=' * 60}")
+    print(f"PARALLEL BENCHMARK")
+    print(f"{'=' * 60}")
+    print(f"File: {x12_file}")
+    print(f"Schema: {schema_file}")
+    print(f"Iterations: {iterations:,}")
+    print(f"Processes: {processes}")
+    print(f"{'=' * 60}\n")
+
+    # Several chunks per worker keeps them balanced without per-task overhead
+    chunksize = max(1, iterations // (processes * 8))
+
+    with multiprocessing.Pool(
+        processes, initializer=_init_worker, initargs=(x12_file, schema_file)
+    ) as pool:
+        # Warmup run (not counted); also waits for the workers to start
+        print("Warming up... ", end="", flush=True)
+        pool.map(_parse_one, range(processes), chunksize=1)
+        print("Done!")
+
+        print(f"Running {iterations:,} iterations... ", end="", flush=True)
+        start_time = time.perf_counter()
+        for _ in pool.imap_unordered(_parse_one, range(iterations), chunksize):
+            pass
+        end_time = time.perf_counter()
+        print("Done!\n")
+
+    total_elapsed = (end_time - start_time) * 1000  # Convert to ms
+    print(f"{'=' * 60}")
+    print(f"RESULTS")
+    print(f"{'=' * 60}")
+    print(
+        f"Total time:       {total_elapsed:>12.2f} ms ({total_elapsed / 1000:.2f} seconds)"
+    )
+    print(f"{'=' * 60}")
+    print(f"THROUGHPUT")
+    print(f"{'=' * 60}")
+    print(f"Parses/second:    {iterations / total_elapsed * 1000:>12.2f}")
+    print(f"Parses/minute:    {iterations / total_elapsed * 60000:>12.2f}")
+    print(f"{'=' * 60}")
+
+
 def demonstrate_usage_options(zx12, x12_file, schema_file):
     """
     Demonstrate the three different ways to use the library
@@ -223,8 +401,8 @@ def demonstrate_usage_options(zx12, x12_file, schema_file):
     print("USAGE EXAMPLES")
     print(f"{'=' * 60}\n")
 
-    # Option 1: Old API - Convenience (loads schema each time)
-    print("Option 1: Convenience API (loads schema each time)")
+    # Option 1: Convenience API - schema loaded on first use and cached by path
+    print("Option 1: Convenience API (schema cached by path)")
     print("-" * 60)
     print("Code:")
     print("  result = zx12.process_file('input.x12', 'schema/837p.json')")
@@ -269,8 +447,8 @@ def demonstrate_usage_options(zx12, x12_file, schema_file):
     print("  with zx12.load_schema('schema/837p.json') as schema:")
     print("      result = zx12.process_string_with_schema(x12_data, schema)")
     print("\nExecuting...")
-    # Read X12 file into string
-    with open(x12_file, "r") as f:
+    # Read X12 file as bytes; no decode/encode round trip is needed
+    with open(x12_file, "rb") as f:
         x12_data = f.read()
     with zx12.load_schema(schema_file) as schema:
         result6 = zx12.process_string_with_schema(x12_data, schema)
@@ -290,6 +468,8 @@ def main():
     benchmark_mode = False
     examples_mode = False
     benchmark_iterations = 10000
+    benchmark_threads_count = 1
+    benchmark_processes_count = 1
     no_timing = False
     args = sys.argv[1:]
 
@@ -317,6 +497,28 @@ def main():
                 print(f"Error: Invalid iterations value", file=sys.stderr)
                 sys.exit(1)
 
+    # Check for thread count
+    for i, arg in enumerate(args):
+        if arg.startswith("--threads="):
+            try:
+                benchmark_threads_count = int(arg.split("=")[1])
+                args.pop(i)
+                break
+            except (ValueError, IndexError):
+                print(f"Error: Invalid threads value", file=sys.stderr)
+                sys.exit(1)
+
+    # Check for process count
+    for i, arg in enumerate(args):
+        if arg.startswith("--parallel="):
+            try:
+                benchmark_processes_count = int(arg.split("=")[1])
+                args.pop(i)
+                break
+            except (ValueError, IndexError):
+                print(f"Error: Invalid parallel value", file=sys.stderr)
+                sys.exit(1)
+
     if len(args) != 2:
         print(
             f"Usage: {sys.argv[0]} <x12_file> <schema_file> [OPTIONS]",
@@ -332,6 +534,14 @@ def main():
             f"  --iterations=N          Number of benchmark iterations (default: 10000)",
             file=sys.stderr,
         )
+        print(
+            f"  --threads=N             Run the benchmark on N threads (throughput only)",
+            file=sys.stderr,
+        )
+        print(
+            f"  --parallel=N            Run the benchmark in N processes (throughput only)",
+            file=sys.stderr,
+        )
         print(
             f"  --no-timing             Skip timing collection (for pure memory leak testing)",
             file=sys.stderr,
@@ -353,6 +563,14 @@ def main():
             f"  {sys.argv[0]} samples/837p_example.x12 schema/837p.json --benchmark --iterations=5000",
             file=sys.stderr,
         )
+        print(
+            f"  {sys.argv[0]} samples/837p_example.x12 schema/837p.json --benchmark --threads=4",
+            file=sys.stderr,
+        )
+        print(
+            f"  {sys.argv[0]} samples/837p_example.x12 schema/837p.json --benchmark --parallel=4",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     x12_file = args[0]
@@ -363,7 +581,24 @@ def main():
         with ZX12() as zx12:
             print(f"zX12 version: {zx12.get_version()}")
 
-            if benchmark_mode:
+            if benchmark_mode and benchmark_processes_count > 1:
+                # Run multi-process throughput benchmark
+                benchmark_processes(
+                    x12_file,
+                    schema_file,
+                    benchmark_iterations,
+                    benchmark_processes_count,
+                )
+            elif benchmark_mode and benchmark_threads_count > 1:
+                # Run multi-threaded throughput benchmark
+                benchmark_threads(
+                    zx12,
+                    x12_file,
+                    schema_file,
+                    benchmark_iterations,
+                    benchmark_threads_count,
+                )
+            elif benchmark_mode:
                 # Run benchmark with pre-loaded schema
                 benchmark(
                     zx12,
@@ -383,17 +618,17 @@ def main():
                 print(f"Processing: {x12_file}")
                 print(f"Schema: {schema_file}")
 
-                # Process file
-                result = zx12.process_file(x12_file, schema_file)
+                # Process file (the library already emits indented JSON)
+                result = zx12.process_file(x12_file, schema_file, raw=True)
 
                 # Print formatted JSON
                 print("\n=== JSON Output ===")
-                print(json.dumps(result, indent=2))
+                print(result.decode("utf-8"))
 
                 # Write to file
                 output_file = "output.json"
-                with open(output_file, "w") as f:
-                    json.dump(result, f, indent=2)
+                with open(output_file, "wb") as f:
+                    f.write(result)
                 print(f"\nOutput written to: {output_file}")
 
     except ZX12Error as e:
@@ -24,6 +24,18 @@ extern "C" {
  */
 typedef struct ZX12_Output ZX12_Output;
 
+/**
+ * Opaque handle to a pre-loaded schema.
+ * Created by zx12_load_schema() and freed with zx12_free_schema().
+ */
+typedef struct ZX12_Schema ZX12_Schema;
+
+/**
+ * Opaque handle to a processing context.
+ * Created by zx12_ctx_create() and freed with zx12_ctx_free().
+ */
+typedef struct ZX12_Context ZX12_Context;
+
 /**
  * Error codes returned by zX12 functions.
  * All functions return 0 (ZX12_SUCCESS) on success.
@@ -41,6 +53,15 @@ typedef enum {
     ZX12_UNKNOWN_ERROR = 99     /**< Unknown error */
 } ZX12_Error;
 
+/**
+ * Output formats accepted by the *_as processing functions.
+ */
+typedef enum {
+    ZX12_FORMAT_JSON_PRETTY = 0,  /**< Indented JSON (the default elsewhere) */
+    ZX12_FORMAT_JSON_COMPACT = 1, /**< JSON without insignificant whitespace */
+    ZX12_FORMAT_MSGPACK = 2       /**< MessagePack; may contain zero bytes, so use the output length */
+} ZX12_Format;
+
 /**
  * Initialize the zX12 library.
  * 
@@ -148,6 +169,211 @@ int zx12_process_from_memory(
     ZX12_Output** output_ptr
 );
 
+/**
+ * Process a batch of X12 documents from memory with a pre-loaded schema.
+ * 
+ * Processes every document in a single call, amortizing the per-call
+ * binding overhead of FFI callers across the batch. On success every
+ * slot of outputs holds a handle that must be freed with
+ * zx12_free_output(). On error no output handles are left allocated.
+ * 
+ * @param x12_data Array of count pointers to X12 data in memory
+ * @param x12_lengths Array of count X12 data lengths in bytes
+ * @param count Number of documents in the batch
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param outputs Array of count slots to receive the output handles
+ * @return ZX12_SUCCESS on success, error code of the first failing document otherwise
+ * 
+ * @example
+ * ```c
+ * const unsigned char* docs[2] = {doc1, doc2};
+ * size_t lengths[2] = {doc1_len, doc2_len};
+ * ZX12_Output* outputs[2];
+ * 
+ * if (zx12_process_from_memory_batch_with_schema(docs, lengths, 2, schema, outputs) == ZX12_SUCCESS) {
+ *     for (int i = 0; i < 2; i++) {
+ *         printf("%s\n", zx12_get_output(outputs[i]));
+ *         zx12_free_output(outputs[i]);
+ *     }
+ * }
+ * ```
+ */
+int zx12_process_from_memory_batch_with_schema(
+    const unsigned char* const* x12_data,
+    const size_t* x12_lengths,
+    size_t count,
+    ZX12_Schema* schema,
+    ZX12_Output** outputs
+);
+
+/**
+ * Process a batch of X12 documents from memory in a chosen output format.
+ * 
+ * Same as zx12_process_from_memory_batch_with_schema(), with every
+ * document serialized in the given format.
+ * 
+ * @param x12_data Array of count pointers to X12 data in memory
+ * @param x12_lengths Array of count X12 data lengths in bytes
+ * @param count Number of documents in the batch
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param outputs Array of count slots to receive the output handles
+ * @return ZX12_SUCCESS on success, error code of the first failing document otherwise
+ */
+int zx12_process_from_memory_batch_with_schema_as(
+    const unsigned char* const* x12_data,
+    const size_t* x12_lengths,
+    size_t count,
+    ZX12_Schema* schema,
+    int format,
+    ZX12_Output** outputs
+);
+
+/**
+ * Process an X12 file with a pre-loaded schema in a chosen output format.
+ * 
+ * Same as zx12_process_document_with_schema(), but lets the caller ask
+ * for compact JSON, which is smaller and faster to produce and parse
+ * when the output is consumed by a program rather than read by a person.
+ * 
+ * @param x12_file_path Path to the X12 file to process (null-terminated)
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param output_ptr Pointer to receive the output handle (must not be NULL)
+ * @return ZX12_SUCCESS on success, ZX12_INVALID_ARGUMENT for an unknown
+ *         format, error code otherwise
+ */
+int zx12_process_document_with_schema_as(
+    const char* x12_file_path,
+    ZX12_Schema* schema,
+    int format,
+    ZX12_Output** output_ptr
+);
+
+/**
+ * Process X12 data from memory with a pre-loaded schema in a chosen output format.
+ * 
+ * @param x12_data Pointer to X12 data in memory
+ * @param x12_length Length of X12 data in bytes
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param output_ptr Pointer to receive the output handle (must not be NULL)
+ * @return ZX12_SUCCESS on success, ZX12_INVALID_ARGUMENT for an unknown
+ *         format, error code otherwise
+ */
+int zx12_process_from_memory_with_schema_as(
+    const unsigned char* x12_data,
+    size_t x12_length,
+    ZX12_Schema* schema,
+    int format,
+    ZX12_Output** output_ptr
+);
+
+/**
+ * Process a batch of X12 files with a pre-loaded schema.
+ * 
+ * Processes every file in a single call, amortizing the per-call binding
+ * overhead of FFI callers across the batch. On success every slot of
+ * outputs holds a handle that must be freed with zx12_free_output().
+ * On error no output handles are left allocated.
+ * 
+ * @param x12_file_paths Array of count paths to X12 files (null-terminated)
+ * @param count Number of files in the batch
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param outputs Array of count slots to receive the output handles
+ * @return ZX12_SUCCESS on success, error code of the first failing file otherwise
+ * 
+ * @example
+ * ```c
+ * const char* paths[2] = {"claim1.x12", "claim2.x12"};
+ * ZX12_Output* outputs[2];
+ * 
+ * if (zx12_process_document_batch_with_schema(paths, 2, schema, outputs) == ZX12_SUCCESS) {
+ *     for (int i = 0; i < 2; i++) {
+ *         printf("%s\n", zx12_get_output(outputs[i]));
+ *         zx12_free_output(outputs[i]);
+ *     }
+ * }
+ * ```
+ */
+int zx12_process_document_batch_with_schema(
+    const char* const* x12_file_paths,
+    size_t count,
+    ZX12_Schema* schema,
+    ZX12_Output** outputs
+);
+
+/**
+ * Process a batch of X12 files with a pre-loaded schema in a chosen output format.
+ * 
+ * Same as zx12_process_document_batch_with_schema(), with every document
+ * serialized in the given format.
+ * 
+ * @param x12_file_paths Array of count paths to X12 files (null-terminated)
+ * @param count Number of files in the batch
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param outputs Array of count slots to receive the output handles
+ * @return ZX12_SUCCESS on success, error code of the first failing file otherwise
+ */
+int zx12_process_document_batch_with_schema_as(
+    const char* const* x12_file_paths,
+    size_t count,
+    ZX12_Schema* schema,
+    int format,
+    ZX12_Output** outputs
+);
+
+/**
+ * Process an X12 file with a pre-loaded schema, returning the output handle.
+ * 
+ * Same as zx12_process_document_with_schema_as(), but returns the handle
+ * directly instead of through an out-parameter. On failure it returns NULL
+ * and the error code is available from zx12_last_error() on the same thread.
+ * 
+ * @param x12_file_path Path to the X12 file to process (null-terminated)
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @return Output handle on success, NULL on error
+ * 
+ * @example
+ * ```c
+ * ZX12_Output* output = zx12_process_document_with_schema_r(
+ *     "input.x12", schema, ZX12_FORMAT_JSON_COMPACT);
+ * if (output == NULL) {
+ *     fprintf(stderr, "Error: %s\n", zx12_get_error_message(zx12_last_error()));
+ * }
+ * ```
+ */
+ZX12_Output* zx12_process_document_with_schema_r(
+    const char* x12_file_path,
+    ZX12_Schema* schema,
+    int format
+);
+
+/**
+ * Process X12 data from memory with a pre-loaded schema, returning the output handle.
+ * 
+ * @param x12_data Pointer to X12 data in memory
+ * @param x12_length Length of X12 data in bytes
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @return Output handle on success, NULL on error (see zx12_last_error())
+ */
+ZX12_Output* zx12_process_from_memory_with_schema_r(
+    const unsigned char* x12_data,
+    size_t x12_length,
+    ZX12_Schema* schema,
+    int format
+);
+
+/**
+ * Get the error code of the last *_r call made on the calling thread.
+ * 
+ * @return ZX12_SUCCESS if that call succeeded, its error code otherwise
+ */
+int zx12_last_error(void);
+
 /**
  * Get the JSON string from an output handle.
  * 
@@ -186,6 +412,26 @@ const char* zx12_get_output(ZX12_Output* output);
  */
 size_t zx12_get_output_length(ZX12_Output* output);
 
+/**
+ * Get the output data and its length in a single call.
+ * 
+ * Equivalent to calling zx12_get_output() and zx12_get_output_length(),
+ * for callers where each call across the boundary has a cost.
+ * 
+ * @param output Output handle from zx12_process_document() or zx12_process_from_memory()
+ * @param length_ptr Pointer to receive the length in bytes, excluding the
+ *                   null terminator (must not be NULL)
+ * @return Null-terminated output data, valid until zx12_free_output() is called
+ * 
+ * @example
+ * ```c
+ * size_t length;
+ * const char* json = zx12_get_output_data(output, &length);
+ * fwrite(json, 1, length, file);
+ * ```
+ */
+const char* zx12_get_output_data(ZX12_Output* output, size_t* length_ptr);
+
 /**
  * Free an output handle and its associated memory.
  * 
@@ -202,6 +448,98 @@ size_t zx12_get_output_length(ZX12_Output* output);
  */
 void zx12_free_output(ZX12_Output* output);
 
+/**
+ * Create a processing context for the *_ctx functions.
+ * 
+ * A context owns an arena that the *_ctx functions allocate from with a bump
+ * pointer. zx12_ctx_reset() keeps the arena's memory for the next call, so a
+ * loop that resets after each document stops allocating once the arena has
+ * grown to fit the largest one. Use a context from one thread at a time.
+ * 
+ * @param ctx_ptr Pointer to receive the context handle (must not be NULL)
+ * @return ZX12_SUCCESS on success, ZX12_OUT_OF_MEMORY otherwise
+ * 
+ * @example
+ * ```c
+ * ZX12_Context* ctx = NULL;
+ * if (zx12_ctx_create(&ctx) == ZX12_SUCCESS) {
+ *     const char* data;
+ *     size_t length;
+ *     if (zx12_process_document_with_schema_ctx(ctx, "input.x12", schema,
+ *             ZX12_FORMAT_JSON_COMPACT, &data, &length) == ZX12_SUCCESS) {
+ *         fwrite(data, 1, length, stdout);
+ *     }
+ *     zx12_ctx_reset(ctx);
+ *     zx12_ctx_free(ctx);
+ * }
+ * ```
+ */
+int zx12_ctx_create(ZX12_Context** ctx_ptr);
+
+/**
+ * Release everything allocated in a context, keeping its memory for reuse.
+ * 
+ * Output returned by earlier *_ctx calls on this context becomes invalid.
+ * Call it after each *_ctx call, whether that call succeeded or not.
+ * 
+ * @param ctx Context handle from zx12_ctx_create()
+ */
+void zx12_ctx_reset(ZX12_Context* ctx);
+
+/**
+ * Free a context and its arena.
+ * 
+ * @param ctx Context handle from zx12_ctx_create()
+ */
+void zx12_ctx_free(ZX12_Context* ctx);
+
+/**
+ * Process an X12 file with a pre-loaded schema inside a context.
+ * 
+ * Parse data and output are allocated in the context's arena; nothing is
+ * returned to free. The output is valid until the next zx12_ctx_reset() or
+ * zx12_ctx_free() on ctx.
+ * 
+ * @param ctx Context handle from zx12_ctx_create()
+ * @param x12_file_path Path to the X12 file to process (null-terminated)
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param data_ptr Pointer to receive the null-terminated output data
+ * @param length_ptr Pointer to receive the output length in bytes, excluding
+ *                   the null terminator
+ * @return ZX12_SUCCESS on success, error code otherwise
+ */
+int zx12_process_document_with_schema_ctx(
+    ZX12_Context* ctx,
+    const char* x12_file_path,
+    ZX12_Schema* schema,
+    int format,
+    const char** data_ptr,
+    size_t* length_ptr
+);
+
+/**
+ * Process X12 data from memory with a pre-loaded schema inside a context.
+ * 
+ * @param ctx Context handle from zx12_ctx_create()
+ * @param x12_data Pointer to X12 data in memory
+ * @param x12_length Length of X12 data in bytes
+ * @param schema Pre-loaded schema handle from zx12_load_schema()
+ * @param format One of ZX12_Format
+ * @param data_ptr Pointer to receive the null-terminated output data
+ * @param length_ptr Pointer to receive the output length in bytes
+ * @return ZX12_SUCCESS on success, error code otherwise
+ */
+int zx12_process_from_memory_with_schema_ctx(
+    ZX12_Context* ctx,
+    const unsigned char* x12_data,
+    size_t x12_length,
+    ZX12_Schema* schema,
+    int format,
+    const char** data_ptr,
+    size_t* length_ptr
+);
+
 /**
  * Get the library version string.
  * 
@@ -236,6 +574,35 @@ const char* zx12_get_version(void);
  */
 const char* zx12_get_error_message(int error_code);
 
+/**
+ * Load an X12 schema from JSON held in memory.
+ * 
+ * Equivalent to loading the schema from a file, for callers that already
+ * have the schema JSON in memory (embedded, cached or memory-mapped).
+ * The JSON is copied, so the buffer may be released once this returns.
+ * The schema handle must be freed with zx12_free_schema() after use.
+ * 
+ * @param schema_data Pointer to the schema JSON in memory
+ * @param schema_length Length of the schema JSON in bytes
+ * @param schema_ptr Pointer to receive the schema handle (must not be NULL)
+ * @return ZX12_SUCCESS on success, ZX12_SCHEMA_LOAD_ERROR if the JSON is
+ *         malformed or not a valid schema, other error code otherwise
+ * 
+ * @example
+ * ```c
+ * ZX12_Schema* schema = NULL;
+ * if (zx12_load_schema_from_memory(schema_json, schema_json_len, &schema) == ZX12_SUCCESS) {
+ *     // Use schema...
+ *     zx12_free_schema(schema);
+ * }
+ * ```
+ */
+int zx12_load_schema_from_memory(
+    const unsigned char* schema_data,
+    size_t schema_length,
+    ZX12_Schema** schema_ptr
+);
+
 #ifdef __cplusplus
 }
 #endif
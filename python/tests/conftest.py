@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from zx12 import ZX12
+
+ROOT = Path(__file__).resolve().parents[2]
+SAMPLES = ROOT / "samples"
+SCHEMAS = ROOT / "schema"
+
+
+@pytest.fixture(scope="session")
+def zx12():
+    """ZX12 instance over ZX12_LIB if set, otherwise the library bundled with the package"""
+    try:
+        instance = ZX12(os.environ.get("ZX12_LIB"))
+    except OSError as e:
+        pytest.skip(f"zX12 library not available: {e}")
+    with instance:
+        yield instance
+
+
+@pytest.fixture
+def schema(zx12):
+    """The 837P schema, freed after the test"""
+    with zx12.load_schema(str(SCHEMAS / "837p.json")) as schema:
+        yield schema
+
+
+@pytest.fixture
+def x12_path():
+    return str(SAMPLES / "837p_example.x12")
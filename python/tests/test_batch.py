@@ -0,0 +1,94 @@
+import pytest
+
+from conftest import SAMPLES
+from zx12 import ZX12Error
+
+SAMPLE_NAMES = ["837p_example.x12", "837p_example_2.x12"]
+
+
+def test_process_strings_with_schema_matches_single_calls(zx12, schema):
+    documents = [(SAMPLES / name).read_bytes() for name in SAMPLE_NAMES]
+    expected = [zx12.process_string_with_schema(doc, schema) for doc in documents]
+    assert zx12.process_strings_with_schema(documents, schema) == expected
+    assert zx12.process_strings_with_schema(
+        [doc.decode("utf-8") for doc in documents], schema, raw=True
+    ) == [zx12.process_string_with_schema(doc, schema, raw=True) for doc in documents]
+
+
+def test_process_strings_with_schema_empty(zx12, schema):
+    assert zx12.process_strings_with_schema([], schema) == []
+
+
+def test_process_strings_with_schema_raises_on_bad_document(zx12, schema):
+    good = (SAMPLES / SAMPLE_NAMES[0]).read_bytes()
+    with pytest.raises(ZX12Error, match="Invalid ISA"):
+        zx12.process_strings_with_schema([good, b"not x12"], schema)
+
+
+def test_process_strings_with_schema_rejects_freed_schema(zx12, schema):
+    schema.free()
+    with pytest.raises(ZX12Error, match="Schema has already been freed"):
+        zx12.process_strings_with_schema([b"ISA"], schema)
+
+
+class FailingLib:
+    """Library wrapper that fails to read the fail_at-th output and records frees"""
+
+    def __init__(self, lib, fail_at):
+        self._lib = lib
+        self.fail_at = fail_at
+        self.reads = 0
+        self.outputs = None
+        self.freed = []
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+    def zx12_process_document_batch_with_schema_as(self, *args):
+        self.outputs = args[-1]
+        return self._lib.zx12_process_document_batch_with_schema_as(*args)
+
+    def zx12_get_output_data(self, output, length_ptr):
+        self.reads += 1
+        if self.reads == self.fail_at:
+            return None
+        return self._lib.zx12_get_output_data(output, length_ptr)
+
+    def zx12_free_output(self, output):
+        self.freed.append(output)
+        self._lib.zx12_free_output(output)
+
+
+def test_process_files_with_schema_matches_single_calls(zx12, schema):
+    paths = [str(SAMPLES / name) for name in SAMPLE_NAMES]
+    expected = [zx12.process_file_with_schema(path, schema) for path in paths]
+    assert zx12.process_files_with_schema(paths, schema) == expected
+    assert zx12.process_files_with_schema(
+        [path.encode("utf-8") for path in paths], schema, raw=True
+    ) == [zx12.process_file_with_schema(path, schema, raw=True) for path in paths]
+
+
+def test_process_files_with_schema_empty(zx12, schema):
+    assert zx12.process_files_with_schema([], schema) == []
+
+
+def test_process_files_with_schema_raises_on_missing_file(zx12, schema, tmp_path):
+    paths = [str(SAMPLES / SAMPLE_NAMES[0]), str(tmp_path / "missing.x12")]
+    with pytest.raises(ZX12Error, match="File not found"):
+        zx12.process_files_with_schema(paths, schema)
+
+
+def test_process_files_with_schema_rejects_freed_schema(zx12, schema):
+    schema.free()
+    with pytest.raises(ZX12Error, match="Schema has already been freed"):
+        zx12.process_files_with_schema([str(SAMPLES / SAMPLE_NAMES[0])], schema)
+
+
+def test_consume_outputs_frees_every_output_when_one_fails(zx12, schema, monkeypatch):
+    lib = FailingLib(zx12.lib, fail_at=2)
+    monkeypatch.setattr(zx12, "lib", lib)
+    paths = [str(SAMPLES / SAMPLE_NAMES[0])] * 4
+    with pytest.raises(ZX12Error, match="Failed to get output"):
+        zx12.process_files_with_schema(paths, schema)
+    assert sorted(lib.freed) == sorted(lib.outputs)
+    assert len(set(lib.freed)) == len(paths)
@@ -0,0 +1,32 @@
+import pytest
+
+from zx12 import ZX12Error
+
+
+def test_compile_for_matches_process_file_with_schema(zx12, schema, x12_path):
+    process = zx12.compile_for(schema)
+    process_raw = zx12.compile_for(schema, raw=True)
+    assert process(x12_path) == zx12.process_file_with_schema(x12_path, schema)
+    assert process(x12_path.encode("utf-8")) == process(x12_path)
+    assert process_raw(x12_path) == zx12.process_file_with_schema(
+        x12_path, schema, raw=True
+    )
+
+
+def test_compile_for_raises_on_processing_error(zx12, schema, tmp_path):
+    process = zx12.compile_for(schema)
+    with pytest.raises(ZX12Error, match="File not found"):
+        process(str(tmp_path / "missing.x12"))
+
+
+def test_compile_for_rejects_freed_schema(zx12, schema):
+    schema.free()
+    with pytest.raises(ZX12Error, match="Schema has already been freed"):
+        zx12.compile_for(schema)
+
+
+def test_compiled_function_rejects_schema_freed_later(zx12, schema, x12_path):
+    process = zx12.compile_for(schema)
+    schema.free()
+    with pytest.raises(ZX12Error, match="Schema has already been freed"):
+        process(x12_path)
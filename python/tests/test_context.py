@@ -0,0 +1,53 @@
+import pytest
+
+from conftest import SAMPLES
+from zx12 import ZX12Error
+
+
+@pytest.fixture
+def context(zx12):
+    with zx12.create_context() as context:
+        yield context
+
+
+def test_process_in_context_matches_process_with_schema(zx12, schema, context):
+    # Several documents in turn, each parsed into the reset arena
+    for name in ["837p_example.x12", "837p_example_2.x12"] * 2:
+        path = str(SAMPLES / name)
+        assert zx12.process_file_in_context(
+            path, schema, context
+        ) == zx12.process_file_with_schema(path, schema)
+        assert zx12.process_string_in_context(
+            (SAMPLES / name).read_bytes(), schema, context, raw=True
+        ) == zx12.process_file_with_schema(path, schema, raw=True)
+
+
+def test_compile_for_with_context(zx12, schema, context, x12_path):
+    process = zx12.compile_for(schema, context=context)
+    expected = zx12.process_file_with_schema(x12_path, schema)
+    assert process(x12_path) == expected
+    assert process(x12_path) == expected
+
+
+def test_context_is_usable_after_an_error(zx12, schema, context, x12_path, tmp_path):
+    with pytest.raises(ZX12Error, match="Invalid ISA"):
+        zx12.process_string_in_context(b"not x12", schema, context)
+    with pytest.raises(ZX12Error, match="File not found"):
+        zx12.process_file_in_context(str(tmp_path / "missing.x12"), schema, context)
+    assert zx12.process_file_in_context(
+        x12_path, schema, context
+    ) == zx12.process_file_with_schema(x12_path, schema)
+
+
+def test_freed_context_is_rejected(zx12, schema, x12_path):
+    context = zx12.create_context()
+    process = zx12.compile_for(schema, context=context)
+    context.free()
+    with pytest.raises(ZX12Error, match="Context has already been freed"):
+        zx12.process_file_in_context(x12_path, schema, context)
+    with pytest.raises(ZX12Error, match="Context has already been freed"):
+        zx12.process_string_in_context(b"ISA", schema, context)
+    with pytest.raises(ZX12Error, match="Context has already been freed"):
+        process(x12_path)
+    with pytest.raises(ZX12Error, match="Context has already been freed"):
+        zx12.compile_for(schema, context=context)
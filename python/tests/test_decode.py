@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+import zx12.zx12 as binding
+from zx12 import ZX12, ZX12Error
+
+
+@pytest.fixture(params=["msgpack", "orjson", "json"])
+def decoder(request, monkeypatch):
+    """Decode parsed output the way the binding does when only this decoder is available"""
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    monkeypatch.setattr(binding, "MSGPACK_AVAILABLE", request.param == "msgpack")
+    monkeypatch.setattr(binding, "ORJSON_AVAILABLE", request.param == "orjson")
+    monkeypatch.setattr(
+        ZX12,
+        "_PARSED_FORMAT",
+        ZX12.FORMAT_MSGPACK if request.param == "msgpack" else ZX12.FORMAT_JSON_COMPACT,
+    )
+    return request.param
+
+
+def test_decoded_output_matches_json_text(zx12, schema, x12_path, decoder):
+    raw = zx12.process_file_with_schema(x12_path, schema, raw=True)
+    assert isinstance(raw, bytes)
+    assert zx12.process_file_with_schema(x12_path, schema) == json.loads(raw)
+    assert zx12.compile_for(schema)(x12_path) == json.loads(raw)
+
+
+def test_batch_output_is_decoded(zx12, schema, x12_path, decoder):
+    expected = json.loads(zx12.process_file_with_schema(x12_path, schema, raw=True))
+    assert zx12.process_files_with_schema([x12_path] * 2, schema) == [expected] * 2
+
+
+def test_processing_errors_are_raised_before_decoding(zx12, schema, decoder):
+    with pytest.raises(ZX12Error, match="Invalid ISA"):
+        zx12.process_string_with_schema(b"not x12", schema)
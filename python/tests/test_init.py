@@ -0,0 +1,42 @@
+import gc
+
+import pytest
+
+import zx12.zx12 as binding
+from zx12 import ZX12, ZX12Error
+
+
+class FailingInitLib:
+    """Library wrapper whose zx12_init fails and which counts zx12_deinit calls"""
+
+    def __init__(self, lib):
+        self._lib = lib
+        self.deinit_calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._lib, name)
+
+    def zx12_init(self):
+        return 99
+
+    def zx12_deinit(self):
+        self.deinit_calls += 1
+
+
+def test_failed_init_is_not_deinitialized(zx12, monkeypatch):
+    lib = FailingInitLib(zx12.lib)
+    monkeypatch.setattr(binding, "_load_library", lambda lib_path: lib)
+    with pytest.raises(ZX12Error, match="Failed to initialize library"):
+        ZX12("unused")
+    gc.collect()
+    assert lib.deinit_calls == 0
+
+
+def test_close_deinitializes_once(zx12, monkeypatch):
+    lib = FailingInitLib(zx12.lib)
+    lib.zx12_init = lambda: 0
+    monkeypatch.setattr(binding, "_load_library", lambda lib_path: lib)
+    with ZX12("unused"):
+        pass
+    gc.collect()
+    assert lib.deinit_calls == 1
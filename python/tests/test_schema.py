@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import pytest
+
+import zx12.zx12 as binding
+from conftest import SCHEMAS
+from zx12 import ZX12Error
+
+
+def test_load_schema_from_bytes_matches_load_schema(zx12, schema, x12_path):
+    schema_json = (SCHEMAS / "837p.json").read_bytes()
+    with zx12.load_schema_from_bytes(schema_json) as from_bytes:
+        assert zx12.process_file_with_schema(
+            x12_path, from_bytes
+        ) == zx12.process_file_with_schema(x12_path, schema)
+
+
+def test_load_schema_from_bytes_accepts_str_and_memoryview(zx12, x12_path):
+    schema_json = (SCHEMAS / "837p.json").read_bytes()
+    with zx12.load_schema_from_bytes(schema_json.decode("utf-8")) as from_str:
+        with zx12.load_schema_from_bytes(memoryview(schema_json)) as from_view:
+            assert zx12.process_file_with_schema(
+                x12_path, from_str
+            ) == zx12.process_file_with_schema(x12_path, from_view)
+
+
+@pytest.mark.parametrize("schema_json", [b"", b"{", b"[]", b"{}", b'"schema"'])
+def test_load_schema_from_bytes_rejects_malformed_json(zx12, schema_json):
+    with pytest.raises(ZX12Error, match="Failed to load schema"):
+        zx12.load_schema_from_bytes(schema_json)
+
+
+def test_load_schema_reports_missing_file(zx12, tmp_path):
+    with pytest.raises(ZX12Error, match="File not found") as excinfo:
+        zx12.load_schema(str(tmp_path / "missing.json"))
+    assert isinstance(excinfo.value.__cause__, FileNotFoundError)
+
+
+def test_load_schema_reports_other_os_errors(zx12, tmp_path):
+    with pytest.raises(ZX12Error) as excinfo:
+        zx12.load_schema(str(tmp_path))
+    assert "File not found" not in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, IsADirectoryError)
+
+
+def test_schema_json_cache_is_bounded_and_keyed_on_absolute_path(
+    zx12, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(binding, "_schema_json_cache", OrderedDict())
+    schema_json = (SCHEMAS / "837p.json").read_bytes()
+    paths = []
+    for i in range(binding._SCHEMA_JSON_CACHE_SIZE + 2):
+        path = tmp_path / f"schema_{i}.json"
+        path.write_bytes(schema_json)
+        paths.append(path)
+        zx12.load_schema(str(path)).free()
+
+    monkeypatch.chdir(tmp_path)
+    zx12.load_schema(paths[-1].name).free()
+
+    assert list(binding._schema_json_cache) == [
+        str(path) for path in paths[-binding._SCHEMA_JSON_CACHE_SIZE :]
+    ]
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from zx12 import ZX12Error
+
+
+class ChunkedStream(io.RawIOBase):
+    """Raw stream that accepts at most chunk_size bytes per write, then limit bytes in all"""
+
+    def __init__(self, chunk_size, limit=None):
+        self.data = bytearray()
+        self.chunk_size = chunk_size
+        self.limit = limit
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.limit is not None and len(self.data) >= self.limit:
+            return 0
+        chunk = bytes(b[: self.chunk_size])
+        self.data += chunk
+        return len(chunk)
+
+
+def test_process_file_to_stream_writes_pretty_json(zx12, schema, x12_path):
+    expected = zx12.process_file_with_schema(x12_path, schema, raw=True)
+    stream = io.BytesIO()
+    assert zx12.process_file_to_stream(x12_path, schema, stream) == len(expected)
+    assert stream.getvalue() == expected
+
+
+def test_process_file_to_stream_finishes_short_writes(zx12, schema, x12_path):
+    expected = zx12.process_file_with_schema(x12_path, schema, raw=True)
+    stream = ChunkedStream(100)
+    assert zx12.process_file_to_stream(x12_path, schema, stream) == len(expected)
+    assert bytes(stream.data) == expected
+
+
+def test_process_file_to_stream_raises_when_stream_stops_accepting(
+    zx12, schema, x12_path
+):
+    with pytest.raises(ZX12Error, match="Short write: stream accepted 300 of"):
+        zx12.process_file_to_stream(x12_path, schema, ChunkedStream(100, limit=300))
+
+
+def test_process_file_to_stream_reports_processing_errors(zx12, schema, tmp_path):
+    stream = io.BytesIO()
+    with pytest.raises(ZX12Error, match="File not found"):
+        zx12.process_file_to_stream(str(tmp_path / "missing.x12"), schema, stream)
+    assert stream.getvalue() == b""
+
+
+def test_process_file_to_stream_rejects_freed_schema(zx12, schema, x12_path):
+    schema.free()
+    with pytest.raises(ZX12Error, match="Schema has already been freed"):
+        zx12.process_file_to_stream(x12_path, schema, io.BytesIO())
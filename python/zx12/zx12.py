@@ -1,8 +1,291 @@
 import ctypes
+import functools
 import json
+from collections import OrderedDict
+import os
 import platform
+import weakref
 from importlib import resources
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def _as_bytes(data):
+    """Return data as a flat byte buffer, encoding only str input as UTF-8"""
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    if isinstance(data, memoryview):
+        return data.cast("B")
+    return data.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_path(path):
+    """Return a path as UTF-8 bytes, passing bytes paths through unchanged"""
+    if isinstance(path, bytes):
+        return path
+    return os.fspath(path).encode("utf-8")
+
+
+def _as_c_buffer(data):
+    """
+    Return data in a form ctypes passes to a c_char_p without copying, and its length
+
+    bytes and writable buffers are passed in place; str is encoded as UTF-8
+    and read-only buffers other than bytes are copied once.
+    """
+    if isinstance(data, bytes):
+        return data, len(data)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+        return data, len(data)
+    view = memoryview(data).cast("B")
+    if view.readonly:
+        data = bytes(view)
+        return data, len(data)
+    return (ctypes.c_char * len(view)).from_buffer(view), len(view)
+
+
+# Schema JSON read by load_schema, most recently used last:
+# absolute path -> (mtime_ns, bytes)
+_schema_json_cache = OrderedDict()
+_SCHEMA_JSON_CACHE_SIZE = 8
+
+
+def _read_schema_json(schema_path):
+    """Return the schema file's JSON, re-reading it only when it has changed"""
+    schema_path = os.path.abspath(os.fspath(schema_path))
+    mtime = os.stat(schema_path).st_mtime_ns
+    cached = _schema_json_cache.get(schema_path)
+    if cached is not None and cached[0] == mtime:
+        _schema_json_cache.move_to_end(schema_path)
+        return cached[1]
+
+    with open(schema_path, "rb") as f:
+        schema_json = f.read()
+    _schema_json_cache[schema_path] = (mtime, schema_json)
+    _schema_json_cache.move_to_end(schema_path)
+    if len(_schema_json_cache) > _SCHEMA_JSON_CACHE_SIZE:
+        _schema_json_cache.popitem(last=False)
+    return schema_json
+
+
+# ctypes signatures of the exported C functions: name -> (restype, argtypes)
+_SIGNATURES = {
+    "zx12_init": (ctypes.c_int, []),
+    "zx12_deinit": (None, []),
+    "zx12_process_document": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_file_path
+            ctypes.c_char_p,  # schema_path
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+    "zx12_process_from_memory": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_data
+            ctypes.c_size_t,  # x12_length
+            ctypes.c_char_p,  # schema_path
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+    "zx12_process_from_memory_batch_with_schema": (
+        ctypes.c_int,
+        [
+            ctypes.POINTER(ctypes.c_char_p),  # x12_data
+            ctypes.POINTER(ctypes.c_size_t),  # x12_lengths
+            ctypes.c_size_t,  # count
+            ctypes.c_void_p,  # schema
+            ctypes.POINTER(ctypes.c_void_p),  # outputs
+        ],
+    ),
+    "zx12_process_from_memory_batch_with_schema_as": (
+        ctypes.c_int,
+        [
+            ctypes.POINTER(ctypes.c_char_p),  # x12_data
+            ctypes.POINTER(ctypes.c_size_t),  # x12_lengths
+            ctypes.c_size_t,  # count
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # outputs
+        ],
+    ),
+    "zx12_process_document_batch_with_schema_as": (
+        ctypes.c_int,
+        [
+            ctypes.POINTER(ctypes.c_char_p),  # x12_file_paths
+            ctypes.c_size_t,  # count
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # outputs
+        ],
+    ),
+    "zx12_process_document_with_schema_r": (
+        ctypes.c_void_p,
+        [
+            ctypes.c_char_p,  # x12_file_path
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+        ],
+    ),
+    "zx12_process_from_memory_with_schema_r": (
+        ctypes.c_void_p,
+        [
+            ctypes.c_char_p,  # x12_data
+            ctypes.c_size_t,  # x12_length
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+        ],
+    ),
+    "zx12_last_error": (ctypes.c_int, []),
+    "zx12_ctx_create": (ctypes.c_int, [ctypes.POINTER(ctypes.c_void_p)]),
+    "zx12_ctx_reset": (None, [ctypes.c_void_p]),
+    "zx12_ctx_free": (None, [ctypes.c_void_p]),
+    "zx12_process_document_with_schema_ctx": (
+        ctypes.c_int,
+        [
+            ctypes.c_void_p,  # ctx
+            ctypes.c_char_p,  # x12_file_path
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # data_ptr
+            ctypes.POINTER(ctypes.c_size_t),  # length_ptr
+        ],
+    ),
+    "zx12_process_from_memory_with_schema_ctx": (
+        ctypes.c_int,
+        [
+            ctypes.c_void_p,  # ctx
+            ctypes.c_char_p,  # x12_data
+            ctypes.c_size_t,  # x12_length
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # data_ptr
+            ctypes.POINTER(ctypes.c_size_t),  # length_ptr
+        ],
+    ),
+    "zx12_get_output": (ctypes.c_void_p, [ctypes.c_void_p]),
+    "zx12_get_output_length": (ctypes.c_size_t, [ctypes.c_void_p]),
+    "zx12_get_output_data": (
+        ctypes.c_void_p,
+        [
+            ctypes.c_void_p,  # output
+            ctypes.POINTER(ctypes.c_size_t),  # length_ptr
+        ],
+    ),
+    "zx12_free_output": (None, [ctypes.c_void_p]),
+    "zx12_get_version": (ctypes.c_char_p, []),
+    "zx12_get_error_message": (ctypes.c_char_p, [ctypes.c_int]),
+    "zx12_load_schema": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # file_path
+            ctypes.POINTER(ctypes.c_void_p),  # schema_ptr
+        ],
+    ),
+    "zx12_load_schema_from_memory": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # schema_data
+            ctypes.c_size_t,  # schema_length
+            ctypes.POINTER(ctypes.c_void_p),  # schema_ptr
+        ],
+    ),
+    "zx12_free_schema": (None, [ctypes.c_void_p]),
+    "zx12_process_document_with_schema": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_file_path
+            ctypes.c_void_p,  # schema
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+    "zx12_process_from_memory_with_schema": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_data
+            ctypes.c_size_t,  # x12_length
+            ctypes.c_void_p,  # schema
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+    "zx12_process_document_with_schema_as": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_file_path
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+    "zx12_process_from_memory_with_schema_as": (
+        ctypes.c_int,
+        [
+            ctypes.c_char_p,  # x12_data
+            ctypes.c_size_t,  # x12_length
+            ctypes.c_void_p,  # schema
+            ctypes.c_int,  # format
+            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
+        ],
+    ),
+}
+
+
+def _configure_lib(lib):
+    """Declare return and argument types for every function in _SIGNATURES"""
+    for name, (restype, argtypes) in _SIGNATURES.items():
+        func = getattr(lib, name)
+        func.restype = restype
+        func.argtypes = argtypes
+
+
+@functools.lru_cache(maxsize=None)
+def _default_lib_path():
+    """Return the path of the library bundled with the package for this platform"""
+    lib_name = "libzx12.so"
+    if platform.system() == "Windows":
+        lib_name = "libzx12.dll"
+    elif platform.system() == "Darwin":
+        # check if arm64
+        if platform.machine() == "arm64":
+            lib_name = "libzx12_arm64.dylib"
+        else:
+            lib_name = "libzx12.dylib"
+
+    # Use importlib.resources to find the library within the package
+    with resources.path("zx12", lib_name) as path:
+        return str(path)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_library(lib_path):
+    """Load and configure the library at lib_path, once per path per process"""
+    lib = ctypes.CDLL(lib_path)
+    _configure_lib(lib)
+    return lib
+
+
+def _release(lib, schemas):
+    """Free the schemas cached by a ZX12 instance and clean up the library"""
+    for schema in schemas.values():
+        schema.free()
+    schemas.clear()
+    lib.zx12_deinit()
+
 
 class ZX12Error(Exception):
     """Exception raised for zX12 errors"""
@@ -13,6 +296,8 @@ class ZX12Error(Exception):
 class Schema:
     """Wrapper for ZX12 schema handle"""
 
+    __slots__ = ("lib", "schema_ptr", "_freed", "_finalizer", "__weakref__")
+
     def __init__(self, lib, schema_ptr):
         """
         Initialize schema wrapper
@@ -24,11 +309,51 @@ class Schema:
         self.lib = lib
         self.schema_ptr = schema_ptr
         self._freed = False
+        # Frees the schema when this object is collected, unless free() ran first
+        self._finalizer = weakref.finalize(self, lib.zx12_free_schema, schema_ptr)
 
-    def __del__(self):
-        """Free schema on destruction"""
+    def __enter__(self):
+        """Context manager support"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager cleanup"""
         self.free()
 
+    def free(self):
+        """Explicitly free the schema"""
+        # The finalizer frees the handle at most once
+        self._finalizer()
+        self._freed = True
+        self.schema_ptr = None
+
+
+class Context:
+    """
+    Wrapper for ZX12 processing context handle
+
+    A context owns a native arena that the *_in_context methods parse into;
+    it is reset after every call and reuses its memory, so processing many
+    documents in turn does no per-call heap allocation. Use a context from
+    one thread at a time.
+    """
+
+    __slots__ = ("lib", "context_ptr", "_freed", "_finalizer", "__weakref__")
+
+    def __init__(self, lib, context_ptr):
+        """
+        Initialize context wrapper
+
+        Args:
+            lib: Reference to zX12 library
+            context_ptr: Pointer to context from zx12_ctx_create
+        """
+        self.lib = lib
+        self.context_ptr = context_ptr
+        self._freed = False
+        # Frees the context when this object is collected, unless free() ran first
+        self._finalizer = weakref.finalize(self, lib.zx12_ctx_free, context_ptr)
+
     def __enter__(self):
         """Context manager support"""
         return self
@@ -38,15 +363,23 @@ class Schema:
         self.free()
 
     def free(self):
-        """Explicitly free the schema"""
-        if not self._freed and self.schema_ptr:
-            self.lib.zx12_free_schema(self.schema_ptr)
-            self._freed = True
-            self.schema_ptr = None
+        """Explicitly free the context and its arena"""
+        # The finalizer frees the handle at most once
+        self._finalizer()
+        self._freed = True
+        self.context_ptr = None
 
 
 class ZX12:
-    """Python wrapper for zX12 C library"""
+    """
+    Python wrapper for zX12 C library
+
+    The *_with_schema methods may be called from several threads at once.
+    process_file and process_string share a per-instance schema cache, so
+    give each thread its own instance when using those.
+    """
+
+    __slots__ = ("lib", "_schemas", "_finalizer", "__weakref__")
 
     # Error codes (must match zx12.h)
     SUCCESS = 0
@@ -60,6 +393,18 @@ class ZX12:
     INVALID_ARGUMENT = 8
     UNKNOWN_ERROR = 99
 
+    # Output formats (must match ZX12_Format in zx12.h)
+    FORMAT_JSON_PRETTY = 0
+    FORMAT_JSON_COMPACT = 1
+    FORMAT_MSGPACK = 2
+
+    # Format requested when the output is parsed into Python objects;
+    # _consume_output decodes it the same way
+    _PARSED_FORMAT = FORMAT_MSGPACK if MSGPACK_AVAILABLE else FORMAT_JSON_COMPACT
+
+    # Schemas kept loaded by process_file/process_string, keyed by path
+    SCHEMA_CACHE_SIZE = 8
+
     def __init__(self, lib_path=None):
         """
         Initialize zX12 library
@@ -68,93 +413,22 @@ class ZX12:
             lib_path: Path to libzx12 shared library. If not provided, it will be loaded from the package.
         """
         if lib_path is None:
-            lib_name = "libzx12.so"
-            if platform.system() == "Windows":
-                lib_name = "libzx12.dll"
-            elif platform.system() == "Darwin":
-                # check if arm64
-                if platform.machine() == "arm64":
-                    lib_name = "libzx12_arm64.dylib"
-                else:
-                    lib_name = "libzx12.dylib"
-
-            # Use importlib.resources to find the library within the package
-            with resources.path("zx12", lib_name) as path:
-                lib_path = str(path)
-
-        # Load shared library
-        self.lib = ctypes.CDLL(lib_path)
-
-        # Define return types and argument types
-        self.lib.zx12_init.restype = ctypes.c_int
-        self.lib.zx12_init.argtypes = []
-
-        self.lib.zx12_deinit.restype = None
-        self.lib.zx12_deinit.argtypes = []
-
-        self.lib.zx12_process_document.restype = ctypes.c_int
-        self.lib.zx12_process_document.argtypes = [
-            ctypes.c_char_p,  # x12_file_path
-            ctypes.c_char_p,  # schema_path
-            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
-        ]
+            lib_path = _default_lib_path()
 
-        self.lib.zx12_process_from_memory.restype = ctypes.c_int
-        self.lib.zx12_process_from_memory.argtypes = [
-            ctypes.POINTER(ctypes.c_ubyte),  # x12_data
-            ctypes.c_size_t,  # x12_length
-            ctypes.c_char_p,  # schema_path
-            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
-        ]
+        # Load shared library, reusing an already configured one for this path
+        self.lib = _load_library(lib_path)
 
-        self.lib.zx12_get_output.restype = ctypes.c_char_p
-        self.lib.zx12_get_output.argtypes = [ctypes.c_void_p]
-
-        self.lib.zx12_get_output_length.restype = ctypes.c_size_t
-        self.lib.zx12_get_output_length.argtypes = [ctypes.c_void_p]
-
-        self.lib.zx12_free_output.restype = None
-        self.lib.zx12_free_output.argtypes = [ctypes.c_void_p]
-
-        self.lib.zx12_get_version.restype = ctypes.c_char_p
-        self.lib.zx12_get_version.argtypes = []
-
-        self.lib.zx12_get_error_message.restype = ctypes.c_char_p
-        self.lib.zx12_get_error_message.argtypes = [ctypes.c_int]
-
-        self.lib.zx12_load_schema.restype = ctypes.c_int
-        self.lib.zx12_load_schema.argtypes = [
-            ctypes.c_char_p,  # file_path
-            ctypes.POINTER(ctypes.c_void_p),  # schema_ptr
-        ]
-
-        self.lib.zx12_free_schema.restype = None
-        self.lib.zx12_free_schema.argtypes = [ctypes.c_void_p]
-
-        self.lib.zx12_process_document_with_schema.restype = ctypes.c_int
-        self.lib.zx12_process_document_with_schema.argtypes = [
-            ctypes.c_char_p,  # x12_file_path
-            ctypes.c_void_p,  # schema
-            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
-        ]
-
-        self.lib.zx12_process_from_memory_with_schema.restype = ctypes.c_int
-        self.lib.zx12_process_from_memory_with_schema.argtypes = [
-            ctypes.POINTER(ctypes.c_ubyte),  # x12_data
-            ctypes.c_size_t,  # x12_length
-            ctypes.c_void_p,  # schema
-            ctypes.POINTER(ctypes.c_void_p),  # output_ptr
-        ]
+        # Schemas loaded by path, least recently used first
+        self._schemas = OrderedDict()
 
         # Initialize library
         result = self.lib.zx12_init()
         if result != self.SUCCESS:
             raise ZX12Error(f"Failed to initialize library: {self._get_error(result)}")
 
-    def __del__(self):
-        """Cleanup library on destruction"""
-        if hasattr(self, "lib"):
-            self.lib.zx12_deinit()
+        # Cleans up when this object is collected, unless __exit__ ran first;
+        # registered only now so a failed init is never matched by a deinit
+        self._finalizer = weakref.finalize(self, _release, self.lib, self._schemas)
 
     def __enter__(self):
         """Context manager support"""
@@ -162,13 +436,146 @@ class ZX12:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager cleanup"""
-        self.__del__()
+        self._finalizer()
 
     def _get_error(self, error_code):
         """Get error message for error code"""
         msg = self.lib.zx12_get_error_message(error_code)
         return msg.decode("utf-8") if msg else f"Unknown error {error_code}"
 
+    def _cached_schema(self, schema_path):
+        """Return the loaded schema for a path, loading it on first use"""
+        schemas = self._schemas
+        schema = schemas.get(schema_path)
+        if schema is not None:
+            schemas.move_to_end(schema_path)
+            return schema
+
+        schema = schemas[schema_path] = self.load_schema(schema_path)
+        if len(schemas) > self.SCHEMA_CACHE_SIZE:
+            schemas.popitem(last=False)[1].free()
+        return schema
+
+    def _decode_output(self, data_ptr, length, raw=False):
+        """
+        Decode output data held in library memory
+
+        Args:
+            data_ptr: Address of the output data
+            length: Length of the output data in bytes
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            dict: Parsed JSON data, or bytes if raw is True
+        """
+        if not raw and MSGPACK_AVAILABLE:
+            # MessagePack output (see _PARSED_FORMAT), read in place
+            return msgpack.unpackb(
+                memoryview((ctypes.c_char * length).from_address(data_ptr)),
+                raw=False,
+            )
+
+        if not raw and ORJSON_AVAILABLE:
+            # orjson reads the library buffer in place, without a copy
+            return orjson.loads(
+                memoryview((ctypes.c_char * length).from_address(data_ptr))
+            )
+
+        # Copy the JSON out of the library buffer in a single pass
+        json_str = ctypes.string_at(data_ptr, length)
+        if raw:
+            return json_str
+
+        # json.loads accepts the UTF-8 bytes as-is
+        return json.loads(json_str)
+
+    def _consume_output(self, output, raw=False):
+        """
+        Decode the output held by an output handle and release the handle
+
+        Args:
+            output: Output handle filled in by one of the zx12_process_* calls
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            dict: Parsed JSON data, or bytes if raw is True
+
+        Raises:
+            ZX12Error: If the output cannot be read
+        """
+        lib = self.lib
+        try:
+            # Fetch the pointer and the length in one call
+            length = ctypes.c_size_t()
+            json_ptr = lib.zx12_get_output_data(output, ctypes.byref(length))
+            if not json_ptr:
+                raise ZX12Error("Failed to get output")
+            return self._decode_output(json_ptr, length.value, raw)
+        finally:
+            # Always free output
+            lib.zx12_free_output(output)
+
+    def _consume_outputs(self, outputs, raw=False):
+        """
+        Decode and release every handle filled in by a batch call
+
+        Args:
+            outputs: ctypes array of output handles
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            list: Parsed JSON data (or bytes if raw is True), in order
+        """
+        results = []
+        try:
+            for output in outputs:
+                results.append(self._consume_output(output, raw))
+        finally:
+            # Free any outputs left behind if consuming one of them failed
+            for output in outputs[len(results) + 1 :]:
+                self.lib.zx12_free_output(output)
+        return results
+
+    def _write_output(self, output, stream):
+        """
+        Write the JSON held by an output handle to a stream and release the handle
+
+        The stream reads straight from the library buffer, so no Python
+        bytes object is created for the output.
+
+        Args:
+            output: Output handle filled in by one of the zx12_process_* calls
+            stream: Binary file object opened for writing
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            ZX12Error: If the output cannot be read or the stream stops accepting it
+        """
+        lib = self.lib
+        try:
+            # Fetch the pointer and the length in one call
+            length = ctypes.c_size_t()
+            json_ptr = lib.zx12_get_output_data(output, ctypes.byref(length))
+            if not json_ptr:
+                raise ZX12Error("Failed to get output")
+            view = memoryview((ctypes.c_char * length.value).from_address(json_ptr))
+            view = view.cast("B")
+            # Raw streams, sockets and pipes may accept only part of a write
+            written = 0
+            while written < len(view):
+                count = stream.write(view[written:])
+                if not count:
+                    raise ZX12Error(
+                        f"Short write: stream accepted {written} of {len(view)} bytes"
+                    )
+                written += count
+            return written
+        finally:
+            # Always free output
+            lib.zx12_free_output(output)
+
     def get_version(self):
         """Get library version string"""
         version = self.lib.zx12_get_version()
@@ -191,10 +598,46 @@ class ZX12:
             with zx12.load_schema("schema/837p.json") as schema:
                 result = zx12.process_file_with_schema("input.x12", schema)
         """
+        # The contents of recently used files are cached per process, so
+        # loading the same unchanged schema again skips the disk read
+        try:
+            schema_json = _read_schema_json(schema_path)
+        except FileNotFoundError as e:
+            raise ZX12Error(
+                f"Failed to load schema: {self._get_error(self.FILE_NOT_FOUND)}"
+            ) from e
+        except OSError as e:
+            raise ZX12Error(f"Failed to load schema: {e}") from e
+
+        return self.load_schema_from_bytes(schema_json)
+
+    def load_schema_from_bytes(self, schema_json):
+        """
+        Load an X12 schema from JSON already in memory
+
+        Useful when the schema is embedded, cached or memory-mapped rather
+        than read from a path. The library keeps its own copy of the JSON.
+
+        Args:
+            schema_json: Schema JSON as a bytes-like object or string
+
+        Returns:
+            Schema: Schema object that can be used with process_file_with_schema
+
+        Raises:
+            ZX12Error: If the JSON is malformed or is not a valid schema
+
+        Example:
+            with open("schema/837p.json", "rb") as f:
+                schema = zx12.load_schema_from_bytes(f.read())
+        """
+        # c_char_p needs a real bytes object
+        schema_bytes = bytes(_as_bytes(schema_json))
         schema_ptr = ctypes.c_void_p()
 
-        result = self.lib.zx12_load_schema(
-            schema_path.encode("utf-8"),
+        result = self.lib.zx12_load_schema_from_memory(
+            schema_bytes,
+            len(schema_bytes),
             ctypes.byref(schema_ptr),
         )
 
@@ -203,54 +646,61 @@ class ZX12:
 
         return Schema(self.lib, schema_ptr)
 
-    def process_file(self, x12_file_path, schema_path):
+    def create_context(self):
+        """
+        Create a processing context for the *_in_context methods
+
+        Returns:
+            Context: Context object; free it with free() or use it as a context manager
+
+        Raises:
+            ZX12Error: If the context cannot be created
+
+        Example:
+            with zx12.create_context() as context:
+                for path in paths:
+                    result = zx12.process_file_in_context(path, schema, context)
+        """
+        context_ptr = ctypes.c_void_p()
+        result = self.lib.zx12_ctx_create(ctypes.byref(context_ptr))
+        if result != self.SUCCESS:
+            raise ZX12Error(f"Failed to create context: {self._get_error(result)}")
+
+        return Context(self.lib, context_ptr)
+
+    def process_file(self, x12_file_path, schema_path, raw=False):
         """
         Process X12 file and return JSON
 
+        The schema is loaded on first use and kept for later calls with
+        the same schema_path (up to SCHEMA_CACHE_SIZE schemas).
+
         Args:
-            x12_file_path: Path to X12 file
+            x12_file_path: Path to X12 file (str or UTF-8 bytes)
             schema_path: Path to schema JSON file
+            raw: Return the JSON text as bytes instead of parsing it
 
         Returns:
-            dict: Parsed JSON data
+            dict: Parsed JSON data, or bytes if raw is True
 
         Raises:
             ZX12Error: If processing fails
         """
-        output = ctypes.c_void_p()
-
-        result = self.lib.zx12_process_document(
-            x12_file_path.encode("utf-8"),
-            schema_path.encode("utf-8"),
-            ctypes.byref(output),
+        return self.process_file_with_schema(
+            x12_file_path, self._cached_schema(schema_path), raw
         )
 
-        if result != self.SUCCESS:
-            raise ZX12Error(self._get_error(result))
-
-        try:
-            # Get JSON string
-            json_str = self.lib.zx12_get_output(output)
-            if not json_str:
-                raise ZX12Error("Failed to get output")
-
-            # Decode and parse JSON
-            json_data = json_str.decode("utf-8")
-            return json.loads(json_data)
-        finally:
-            # Always free output
-            self.lib.zx12_free_output(output)
-
-    def process_file_with_schema(self, x12_file_path, schema):
+    def process_file_with_schema(self, x12_file_path, schema, raw=False):
         """
         Process X12 file with pre-loaded schema and return JSON
 
         Args:
-            x12_file_path: Path to X12 file
+            x12_file_path: Path to X12 file (str or UTF-8 bytes)
             schema: Schema object from load_schema()
+            raw: Return the JSON text as bytes instead of parsing it
 
         Returns:
-            dict: Parsed JSON data
+            dict: Parsed JSON data, or bytes if raw is True
 
         Raises:
             ZX12Error: If processing fails
@@ -264,40 +714,153 @@ class ZX12:
         if schema._freed:
             raise ZX12Error("Schema has already been freed")
 
-        output = ctypes.c_void_p()
-
-        result = self.lib.zx12_process_document_with_schema(
-            x12_file_path.encode("utf-8"),
+        # Ask for the parsed format unless the JSON text itself is being returned
+        output = self.lib.zx12_process_document_with_schema_r(
+            _encode_path(x12_file_path),
             schema.schema_ptr,
-            ctypes.byref(output),
+            self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
         )
 
-        if result != self.SUCCESS:
-            raise ZX12Error(self._get_error(result))
+        if not output:
+            raise ZX12Error(self._get_error(self.lib.zx12_last_error()))
 
-        try:
-            # Get JSON string
-            json_str = self.lib.zx12_get_output(output)
-            if not json_str:
-                raise ZX12Error("Failed to get output")
+        return self._consume_output(output, raw)
 
-            # Decode and parse JSON
-            json_data = json_str.decode("utf-8")
-            return json.loads(json_data)
-        finally:
-            # Always free output
-            self.lib.zx12_free_output(output)
+    def compile_for(self, schema, raw=False, context=None):
+        """
+        Build a function that processes X12 files with one pre-loaded schema
+
+        The returned function does the same as process_file_with_schema
+        (or process_file_in_context when a context is given), with the
+        native call, schema handle and output format looked up once here
+        instead of on every call.
+
+        Args:
+            schema: Schema object from load_schema()
+            raw: Have the function return the JSON text as bytes instead of parsing it
+            context: Context from create_context() to process in, reset after each call
+
+        Returns:
+            callable: Function taking an X12 file path (str or UTF-8 bytes) and
+            returning parsed JSON data, or bytes if raw is True
+
+        Raises:
+            ZX12Error: If the schema or context has been freed; the returned
+            function raises it if processing fails
 
-    def process_string_with_schema(self, x12_data, schema):
+        Example:
+            with zx12.load_schema("schema/837p.json") as schema:
+                process = zx12.compile_for(schema)
+                results = [process(path) for path in paths]
+        """
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+        if context is not None and context._freed:
+            raise ZX12Error("Context has already been freed")
+
+        lib = self.lib
+        get_error = self._get_error
+        schema_ptr = schema.schema_ptr
+        output_format = self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT
+
+        if context is not None:
+            process_in_context = lib.zx12_process_document_with_schema_ctx
+            reset_context = lib.zx12_ctx_reset
+            decode_output = self._decode_output
+            context_ptr = context.context_ptr
+            data = ctypes.c_void_p()
+            length = ctypes.c_size_t()
+            data_ref = ctypes.byref(data)
+            length_ref = ctypes.byref(length)
+
+            def process_with_context(x12_file_path):
+                # The handles would dangle once the schema or context is freed
+                if schema._freed:
+                    raise ZX12Error("Schema has already been freed")
+                if context._freed:
+                    raise ZX12Error("Context has already been freed")
+                try:
+                    result = process_in_context(
+                        context_ptr,
+                        _encode_path(x12_file_path),
+                        schema_ptr,
+                        output_format,
+                        data_ref,
+                        length_ref,
+                    )
+                    if result != 0:
+                        raise ZX12Error(get_error(result))
+                    return decode_output(data.value, length.value, raw)
+                finally:
+                    reset_context(context_ptr)
+
+            return process_with_context
+
+        process_document = lib.zx12_process_document_with_schema_r
+        last_error = lib.zx12_last_error
+        consume_output = self._consume_output
+
+        def process(x12_file_path):
+            # The handle would dangle once the schema is freed
+            if schema._freed:
+                raise ZX12Error("Schema has already been freed")
+            output = process_document(
+                _encode_path(x12_file_path), schema_ptr, output_format
+            )
+            if not output:
+                raise ZX12Error(get_error(last_error()))
+            return consume_output(output, raw)
+
+        return process
+
+    def process_file_to_stream(self, x12_file_path, schema, stream):
+        """
+        Process X12 file with pre-loaded schema and write the JSON to a stream
+
+        The JSON is written exactly as produced by the library (indented),
+        without being copied into Python or parsed.
+
+        Args:
+            x12_file_path: Path to X12 file (str or UTF-8 bytes)
+            schema: Schema object from load_schema()
+            stream: Binary file object opened for writing
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            ZX12Error: If processing fails
+
+        Example:
+            with zx12.load_schema("schema/837p.json") as schema:
+                with open("output.json", "wb") as f:
+                    zx12.process_file_to_stream("input.x12", schema, f)
+        """
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+
+        output = self.lib.zx12_process_document_with_schema_r(
+            _encode_path(x12_file_path),
+            schema.schema_ptr,
+            self.FORMAT_JSON_PRETTY,
+        )
+
+        if not output:
+            raise ZX12Error(self._get_error(self.lib.zx12_last_error()))
+
+        return self._write_output(output, stream)
+
+    def process_string_with_schema(self, x12_data, schema, raw=False):
         """
-        Process X12 data from string with pre-loaded schema and return JSON
+        Process X12 data from bytes or string with pre-loaded schema and return JSON
 
         Args:
-            x12_data: X12 data as string
+            x12_data: X12 data as a bytes-like object or string
             schema: Schema object from load_schema()
+            raw: Return the JSON text as bytes instead of parsing it
 
         Returns:
-            dict: Parsed JSON data
+            dict: Parsed JSON data, or bytes if raw is True
 
         Raises:
             ZX12Error: If processing fails
@@ -311,64 +874,214 @@ class ZX12:
         if schema._freed:
             raise ZX12Error("Schema has already been freed")
 
-        x12_bytes = x12_data.encode("utf-8")
-        x12_array = (ctypes.c_ubyte * len(x12_bytes))(*x12_bytes)
-        output = ctypes.c_void_p()
+        x12_buffer, x12_length = _as_c_buffer(x12_data)
 
-        result = self.lib.zx12_process_from_memory_with_schema(
-            x12_array, len(x12_bytes), schema.schema_ptr, ctypes.byref(output)
+        # Ask for the parsed format unless the JSON text itself is being returned
+        output = self.lib.zx12_process_from_memory_with_schema_r(
+            x12_buffer,
+            x12_length,
+            schema.schema_ptr,
+            self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
         )
 
-        if result != self.SUCCESS:
-            raise ZX12Error(self._get_error(result))
+        if not output:
+            raise ZX12Error(self._get_error(self.lib.zx12_last_error()))
 
-        try:
-            # Get JSON string
-            json_str = self.lib.zx12_get_output(output)
-            if not json_str:
-                raise ZX12Error("Failed to get output")
+        return self._consume_output(output, raw)
+
+    def process_file_in_context(self, x12_file_path, schema, context, raw=False):
+        """
+        Process X12 file with pre-loaded schema inside a processing context
+
+        Parsing and output use the context's arena, which is reset once the
+        result has been decoded; no native memory is allocated or freed per
+        call after the arena has grown to fit the largest document.
+
+        Args:
+            x12_file_path: Path to X12 file (str or UTF-8 bytes)
+            schema: Schema object from load_schema()
+            context: Context object from create_context()
+            raw: Return the JSON text as bytes instead of parsing it
 
-            # Decode and parse JSON
-            json_data = json_str.decode("utf-8")
-            return json.loads(json_data)
+        Returns:
+            dict: Parsed JSON data, or bytes if raw is True
+
+        Raises:
+            ZX12Error: If processing fails
+
+        Example:
+            with zx12.load_schema("schema/837p.json") as schema:
+                with zx12.create_context() as context:
+                    result = zx12.process_file_in_context("input.x12", schema, context)
+        """
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+        if context._freed:
+            raise ZX12Error("Context has already been freed")
+
+        data = ctypes.c_void_p()
+        length = ctypes.c_size_t()
+        try:
+            result = self.lib.zx12_process_document_with_schema_ctx(
+                context.context_ptr,
+                _encode_path(x12_file_path),
+                schema.schema_ptr,
+                self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
+                ctypes.byref(data),
+                ctypes.byref(length),
+            )
+            if result != self.SUCCESS:
+                raise ZX12Error(self._get_error(result))
+            return self._decode_output(data.value, length.value, raw)
         finally:
-            # Always free output
-            self.lib.zx12_free_output(output)
+            # Decoding copies the result out, so the arena can be reused
+            self.lib.zx12_ctx_reset(context.context_ptr)
 
-    def process_string(self, x12_data, schema_path):
+    def process_string_in_context(self, x12_data, schema, context, raw=False):
         """
-        Process X12 data from string and return JSON
+        Process X12 data from bytes or string with pre-loaded schema inside a processing context
 
         Args:
-            x12_data: X12 data as string
-            schema_path: Path to schema JSON file
+            x12_data: X12 data as a bytes-like object or string
+            schema: Schema object from load_schema()
+            context: Context object from create_context()
+            raw: Return the JSON text as bytes instead of parsing it
 
         Returns:
-            dict: Parsed JSON data
+            dict: Parsed JSON data, or bytes if raw is True
 
         Raises:
             ZX12Error: If processing fails
         """
-        x12_bytes = x12_data.encode("utf-8")
-        x12_array = (ctypes.c_ubyte * len(x12_bytes))(*x12_bytes)
-        output = ctypes.c_void_p()
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+        if context._freed:
+            raise ZX12Error("Context has already been freed")
+
+        x12_buffer, x12_length = _as_c_buffer(x12_data)
+        data = ctypes.c_void_p()
+        length = ctypes.c_size_t()
+        try:
+            result = self.lib.zx12_process_from_memory_with_schema_ctx(
+                context.context_ptr,
+                x12_buffer,
+                x12_length,
+                schema.schema_ptr,
+                self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
+                ctypes.byref(data),
+                ctypes.byref(length),
+            )
+            if result != self.SUCCESS:
+                raise ZX12Error(self._get_error(result))
+            return self._decode_output(data.value, length.value, raw)
+        finally:
+            # Decoding copies the result out, so the arena can be reused
+            self.lib.zx12_ctx_reset(context.context_ptr)
+
+    def process_strings_with_schema(self, x12_documents, schema, raw=False):
+        """
+        Process many X12 documents from memory with a single native call
+
+        Args:
+            x12_documents: Iterable of X12 data as bytes-like objects or strings
+            schema: Schema object from load_schema()
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            list: Parsed JSON data (or bytes if raw is True) for each document,
+            in input order
+
+        Raises:
+            ZX12Error: If processing any document fails
 
-        result = self.lib.zx12_process_from_memory(
-            x12_array, len(x12_bytes), schema_path.encode("utf-8"), ctypes.byref(output)
+        Example:
+            with zx12.load_schema("schema/837p.json") as schema:
+                results = zx12.process_strings_with_schema([x12_1, x12_2], schema)
+        """
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+
+        # c_char_p arrays need real bytes objects
+        x12_bytes = [bytes(_as_bytes(x12_data)) for x12_data in x12_documents]
+        count = len(x12_bytes)
+        if count == 0:
+            return []
+
+        outputs = (ctypes.c_void_p * count)()
+        result = self.lib.zx12_process_from_memory_batch_with_schema_as(
+            (ctypes.c_char_p * count)(*x12_bytes),
+            (ctypes.c_size_t * count)(*map(len, x12_bytes)),
+            count,
+            schema.schema_ptr,
+            self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
+            outputs,
         )
 
         if result != self.SUCCESS:
             raise ZX12Error(self._get_error(result))
 
-        try:
-            # Get JSON string
-            json_str = self.lib.zx12_get_output(output)
-            if not json_str:
-                raise ZX12Error("Failed to get output")
+        return self._consume_outputs(outputs, raw)
 
-            # Decode and parse JSON
-            json_data = json_str.decode("utf-8")
-            return json.loads(json_data)
-        finally:
-            # Always free output
-            self.lib.zx12_free_output(output)
+    def process_files_with_schema(self, x12_file_paths, schema, raw=False):
+        """
+        Process many X12 files with a single native call
+
+        Args:
+            x12_file_paths: Iterable of paths to X12 files (str or UTF-8 bytes)
+            schema: Schema object from load_schema()
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            list: Parsed JSON data (or bytes if raw is True) for each file,
+            in input order
+
+        Raises:
+            ZX12Error: If processing any file fails
+
+        Example:
+            with zx12.load_schema("schema/837p.json") as schema:
+                results = zx12.process_files_with_schema(["in1.x12", "in2.x12"], schema)
+        """
+        if schema._freed:
+            raise ZX12Error("Schema has already been freed")
+
+        paths = [_encode_path(x12_file_path) for x12_file_path in x12_file_paths]
+        count = len(paths)
+        if count == 0:
+            return []
+
+        outputs = (ctypes.c_void_p * count)()
+        result = self.lib.zx12_process_document_batch_with_schema_as(
+            (ctypes.c_char_p * count)(*paths),
+            count,
+            schema.schema_ptr,
+            self.FORMAT_JSON_PRETTY if raw else self._PARSED_FORMAT,
+            outputs,
+        )
+
+        if result != self.SUCCESS:
+            raise ZX12Error(self._get_error(result))
+
+        return self._consume_outputs(outputs, raw)
+
+    def process_string(self, x12_data, schema_path, raw=False):
+        """
+        Process X12 data from bytes or string and return JSON
+
+        The schema is loaded on first use and kept for later calls with
+        the same schema_path (up to SCHEMA_CACHE_SIZE schemas).
+
+        Args:
+            x12_data: X12 data as a bytes-like object or string
+            schema_path: Path to schema JSON file
+            raw: Return the JSON text as bytes instead of parsing it
+
+        Returns:
+            dict: Parsed JSON data, or bytes if raw is True
+
+        Raises:
+            ZX12Error: If processing fails
+        """
+        return self.process_string_with_schema(
+            x12_data, self._cached_schema(schema_path), raw
+        )
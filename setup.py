@@ -1,6 +1,7 @@
 import os
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from setuptools import setup, find_packages
 from setuptools.command.build_py import build_py
 
@@ -10,75 +11,40 @@ class ZigBuilder(build_py):
         # Get the directory of the setup.py script
         setup_dir = os.getenv("ZX12_PATH", os.getcwd())
 
-        # Run zig build
+        # Run zig build for every target at once; the builds are independent
+        targets = [
+            ("libzx12.so", []),
+            ("libzx12.dll", ["-target", "x86_64-windows-gnu"]),
+            ("libzx12.dylib", ["-target", "x86_64-macos"]),
+            ("libzx12_arm64.dylib", ["-target", "aarch64-macos"]),
+        ]
+        commands = [
+            [
+                "zig",
+                "build-lib",
+                "./src/main.zig",
+                "-lc",
+                "-OReleaseFast",
+                f"-femit-bin=./zig-out/lib/{lib_name}",
+                "-dynamic",
+                *target_args,
+            ]
+            for lib_name, target_args in targets
+        ]
         try:
-            subprocess.check_call(
-                [
-                    "zig",
-                    "build-lib",
-                    "./src/main.zig",
-                    "-lc",
-                    "-OReleaseFast",
-                    "-femit-bin=./zig-out/lib/libzx12.so",
-                    "-dynamic",
-                ],
-                cwd=setup_dir,
-            )
-            subprocess.check_call(
-                [
-                    "zig",
-                    "build-lib",
-                    "./src/main.zig",
-                    "-lc",
-                    "-OReleaseFast",
-                    "-femit-bin=./zig-out/lib/libzx12.dll",
-                    "-dynamic",
-                    "-target",
-                    "x86_64-windows-gnu",
-                ],
-                cwd=setup_dir,
-            )
-            subprocess.check_call(
-                [
-                    "zig",
-                    "build-lib",
-                    "./src/main.zig",
-                    "-lc",
-                    "-OReleaseFast",
-                    "-femit-bin=./zig-out/lib/libzx12.dylib",
-                    "-dynamic",
-                    "-target",
-                    "x86_64-macos",
-                ],
-                cwd=setup_dir,
-            )
-
-            subprocess.check_call(
-                [
-                    "zig",
-                    "build-lib",
-                    "./src/main.zig",
-                    "-lc",
-                    "-OReleaseFast",
-                    "-femit-bin=./zig-out/lib/libzx12_arm64.dylib",
-                    "-dynamic",
-                    "-target",
-                    "aarch64-macos",
-                ],
-                cwd=setup_dir,
-            )
+            with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+                builds = [
+                    pool.submit(subprocess.check_call, command, cwd=setup_dir)
+                    for command in commands
+                ]
+                for build in builds:
+                    build.result()
         except subprocess.CalledProcessError as e:
             print(f"Error during zig build: {e}")
             raise
 
         # Copy the built library to the package directory
-        lib_names = [
-            "libzx12.so",
-            "libzx12.dll",
-            "libzx12.dylib",
-            "libzx12_arm64.dylib",
-        ]
-        for lib_name in lib_names:
+        for lib_name, _ in targets:
             lib_path = os.path.join(setup_dir, "zig-out", "lib", lib_name)
             target_path = os.path.join(setup_dir, "python", "zx12", lib_name)
             self.copy_file(lib_path, target_path)
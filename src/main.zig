@@ -1,6 +1,7 @@
 const std = @import("std");
 const document_processor = @import("x12_parser/document_processor.zig");
 const schema_load = @import("x12_parser/schema.zig").loadSchema;
+const schema_load_from_slice = @import("x12_parser/schema.zig").loadSchemaFromSlice;
 const Schema = @import("x12_parser/schema.zig").Schema;
 pub const X12_File = document_processor.X12_File;
 // ============================================================================
@@ -10,6 +11,7 @@ pub const X12_File = document_processor.X12_File;
 /// Opaque handle to processed JSON output
 pub const ZX12_Output = opaque {};
 pub const ZX12_Schema = opaque {};
+pub const ZX12_Context = opaque {};
 
 /// Error codes returned by C API functions
 pub const ZX12_Error = enum(c_int) {
@@ -25,6 +27,23 @@ pub const ZX12_Error = enum(c_int) {
     UnknownError = 99,
 };
 
+/// Output formats accepted by the *_as processing functions
+pub const ZX12_Format = enum(c_int) {
+    JsonPretty = 0,
+    JsonCompact = 1,
+    Msgpack = 2,
+};
+
+/// Convert a C output format value to the serializer's format
+fn formatFromCode(format: c_int) ?document_processor.OutputFormat {
+    return switch (format) {
+        @intFromEnum(ZX12_Format.JsonPretty) => .json_pretty,
+        @intFromEnum(ZX12_Format.JsonCompact) => .json_compact,
+        @intFromEnum(ZX12_Format.Msgpack) => .msgpack,
+        else => null,
+    };
+}
+
 /// Convert Zig error to C error code
 fn errorToCode(err: anyerror) ZX12_Error {
     return switch (err) {
@@ -32,7 +51,7 @@ fn errorToCode(err: anyerror) ZX12_Error {
         error.InvalidISA => .InvalidISA,
         error.FileNotFound => .FileNotFound,
         error.ParseError => .ParseError,
-        error.SchemaLoadError => .SchemaLoadError,
+        error.SchemaLoadError, error.InvalidSchema => .SchemaLoadError,
         error.UnknownHLLevel => .UnknownHLLevel,
         error.PathConflict => .PathConflict,
         else => .UnknownError,
@@ -40,8 +59,10 @@ fn errorToCode(err: anyerror) ZX12_Error {
 }
 
 /// Global allocator for C API (uses C allocator for simplicity and thread-safety)
+/// malloc keeps freed blocks for reuse, so the output buffer and handle of one
+/// call are recycled by the next instead of being mapped and unmapped each time
 fn getGlobalAllocator() std.mem.Allocator {
-    return std.heap.page_allocator;
+    return std.heap.c_allocator;
 }
 
 /// Initialize the zX12 library
@@ -95,35 +116,7 @@ export fn zx12_process_document(
         return @intFromEnum(errorToCode(err));
     };
 
-    // Get the data from ArrayList
-    const length = json_output.items.len;
-
-    // Allocate buffer with room for null terminator
-    const data = allocator.alloc(u8, length + 1) catch {
-        json_output.deinit(allocator);
-        return @intFromEnum(ZX12_Error.OutOfMemory);
-    };
-
-    // Copy data and add null terminator
-    @memcpy(data[0..length], json_output.items);
-    data[length] = 0;
-
-    // Free the ArrayList
-    json_output.deinit(allocator);
-
-    // Create output handle
-    const handle = allocator.create(OutputHandle) catch {
-        allocator.free(data);
-        return @intFromEnum(ZX12_Error.OutOfMemory);
-    };
-
-    handle.* = .{
-        .data = data,
-        .length = length,
-    };
-
-    output_ptr.* = @ptrCast(handle);
-    return @intFromEnum(ZX12_Error.Success);
+    return wrapOutput(allocator, &json_output, output_ptr);
 }
 
 /// Process an X12 document with a pre-loaded schema
@@ -149,8 +142,33 @@ export fn zx12_process_document_with_schema(
     x12_file_path: [*:0]const u8,
     schema: *ZX12_Schema,
     output_ptr: *?*ZX12_Output,
+) c_int {
+    return zx12_process_document_with_schema_as(
+        x12_file_path,
+        schema,
+        @intFromEnum(ZX12_Format.JsonPretty),
+        output_ptr,
+    );
+}
+
+/// Process an X12 document with a pre-loaded schema in a chosen output format
+///
+/// @param x12_file_path Path to the X12 file to process (null-terminated C string)
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param output_ptr Pointer to receive the output handle (must not be null)
+/// @return 0 on success, error code otherwise
+///
+/// Compact JSON has no indentation or newlines, so it is smaller and
+/// quicker to produce and to parse when nobody reads it directly.
+export fn zx12_process_document_with_schema_as(
+    x12_file_path: [*:0]const u8,
+    schema: *ZX12_Schema,
+    format: c_int,
+    output_ptr: *?*ZX12_Output,
 ) c_int {
     const allocator = getGlobalAllocator();
+    const output_format = formatFromCode(format) orelse return @intFromEnum(ZX12_Error.InvalidArgument);
 
     // Convert C string to Zig slice
     const x12_path = std.mem.span(x12_file_path);
@@ -160,39 +178,49 @@ export fn zx12_process_document_with_schema(
     const schema_handle: *SchemaHandle = @ptrCast(@alignCast(schema));
 
     // Process document with pre-loaded schema
-    var json_output = document_processor.processDocument(
+    var json_output = document_processor.processDocumentAs(
         allocator,
         &x12_file,
         null, // schema_file not needed since we're passing the schema
         schema_handle.schema,
+        output_format,
     ) catch |err| {
         return @intFromEnum(errorToCode(err));
     };
 
-    // Get the data from ArrayList
+    return wrapOutput(allocator, &json_output, output_ptr);
+}
+
+// Internal structure to store output with length
+// The buffer is the serializer's own list, null-terminated in place
+const OutputHandle = struct {
+    buffer: std.ArrayList(u8),
+    length: usize,
+};
+
+/// Wrap serialized JSON in an output handle without copying it
+/// Takes ownership of json_output; it is freed if the handle cannot be created
+fn wrapOutput(
+    allocator: std.mem.Allocator,
+    json_output: *std.ArrayList(u8),
+    output_ptr: *?*ZX12_Output,
+) c_int {
     const length = json_output.items.len;
 
-    // Allocate buffer with room for null terminator
-    const data = allocator.alloc(u8, length + 1) catch {
+    // Add null terminator in place (usually fits in the list's spare capacity)
+    json_output.append(allocator, 0) catch {
         json_output.deinit(allocator);
         return @intFromEnum(ZX12_Error.OutOfMemory);
     };
 
-    // Copy data and add null terminator
-    @memcpy(data[0..length], json_output.items);
-    data[length] = 0;
-
-    // Free the ArrayList
-    json_output.deinit(allocator);
-
     // Create output handle
     const handle = allocator.create(OutputHandle) catch {
-        allocator.free(data);
+        json_output.deinit(allocator);
         return @intFromEnum(ZX12_Error.OutOfMemory);
     };
 
     handle.* = .{
-        .data = data,
+        .buffer = json_output.*,
         .length = length,
     };
 
@@ -200,12 +228,6 @@ export fn zx12_process_document_with_schema(
     return @intFromEnum(ZX12_Error.Success);
 }
 
-// Internal structure to store output with length
-const OutputHandle = struct {
-    data: []u8,
-    length: usize,
-};
-
 // Internal structure to store schema
 const SchemaHandle = struct {
     schema: Schema,
@@ -219,8 +241,8 @@ const SchemaHandle = struct {
 /// The returned string is valid until zx12_free_output is called
 export fn zx12_get_output(output: *ZX12_Output) ?[*:0]const u8 {
     const handle: *OutputHandle = @ptrCast(@alignCast(output));
-    // The data is already null-terminated from dupe
-    return @ptrCast(handle.data.ptr);
+    // The buffer is null-terminated by wrapOutput
+    return @ptrCast(handle.buffer.items.ptr);
 }
 
 /// Get the length of the JSON output (excluding null terminator)
@@ -232,13 +254,25 @@ export fn zx12_get_output_length(output: *ZX12_Output) usize {
     return handle.length;
 }
 
+/// Get the output data and its length in a single call
+///
+/// @param output Output handle from zx12_process_document
+/// @param length_ptr Pointer to receive the length in bytes (excluding null terminator)
+/// @return Null-terminated output data, valid until zx12_free_output is called
+export fn zx12_get_output_data(output: *ZX12_Output, length_ptr: *usize) [*:0]const u8 {
+    const handle: *OutputHandle = @ptrCast(@alignCast(output));
+    length_ptr.* = handle.length;
+    // The buffer is null-terminated by wrapOutput
+    return @ptrCast(handle.buffer.items.ptr);
+}
+
 /// Free the output handle and its associated memory
 ///
 /// @param output Output handle from zx12_process_document
 export fn zx12_free_output(output: *ZX12_Output) void {
     const allocator = getGlobalAllocator();
     const handle: *OutputHandle = @ptrCast(@alignCast(output));
-    allocator.free(handle.data);
+    handle.buffer.deinit(allocator);
     allocator.destroy(handle);
 }
 
@@ -255,22 +289,23 @@ export fn zx12_process_from_memory(
     schema_path: [*:0]const u8,
     output_ptr: *?*ZX12_Output,
 ) c_int {
-    var io_threaded: std.Io.Threaded = .init(getGlobalAllocator(), .{});
-    // Write X12 data to temporary file
-    const temp_filename = "temp_zx12_input.x12";
-    const file = std.Io.Dir.cwd().createFile(io_threaded.io(), temp_filename, .{}) catch |err| {
-        return @intFromEnum(errorToCode(err));
-    };
-    defer file.close(io_threaded.io());
-    defer std.Io.Dir.cwd().deleteFile(io_threaded.io(), temp_filename) catch {};
+    const allocator = getGlobalAllocator();
 
-    const x12_slice = x12_data[0..x12_length];
-    file.writePositionalAll(io_threaded.io(), x12_slice, 0) catch |err| {
+    // Parse straight from the caller's buffer; nothing touches the filesystem
+    // except the schema, so concurrent calls do not interfere with each other
+    const schema_file = std.mem.span(schema_path);
+    var x12_file = X12_File{ .file_contents = @constCast(x12_data[0..x12_length]), .file_path = null };
+
+    var json_output = document_processor.processDocument(
+        allocator,
+        &x12_file,
+        schema_file,
+        null,
+    ) catch |err| {
         return @intFromEnum(errorToCode(err));
     };
 
-    // Process using file-based function
-    return zx12_process_document(temp_filename, schema_path, output_ptr);
+    return wrapOutput(allocator, &json_output, output_ptr);
 }
 
 /// Process X12 document from memory buffer with a pre-loaded schema
@@ -299,48 +334,364 @@ export fn zx12_process_from_memory_with_schema(
     x12_length: usize,
     schema: *ZX12_Schema,
     output_ptr: *?*ZX12_Output,
+) c_int {
+    return zx12_process_from_memory_with_schema_as(
+        x12_data,
+        x12_length,
+        schema,
+        @intFromEnum(ZX12_Format.JsonPretty),
+        output_ptr,
+    );
+}
+
+/// Process X12 document from memory with a pre-loaded schema in a chosen output format
+///
+/// @param x12_data Pointer to X12 data in memory
+/// @param x12_length Length of X12 data in bytes
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param output_ptr Pointer to receive the output handle (must not be null)
+/// @return 0 on success, error code otherwise
+export fn zx12_process_from_memory_with_schema_as(
+    x12_data: [*]const u8,
+    x12_length: usize,
+    schema: *ZX12_Schema,
+    format: c_int,
+    output_ptr: *?*ZX12_Output,
 ) c_int {
     const allocator = getGlobalAllocator();
+    const output_format = formatFromCode(format) orelse return @intFromEnum(ZX12_Error.InvalidArgument);
     var x12_file = X12_File{ .file_contents = @constCast(x12_data[0..x12_length]), .file_path = null };
     const schema_handle: *SchemaHandle = @ptrCast(@alignCast(schema));
     // Process document
-    var json_output = document_processor.processDocument(
+    var json_output = document_processor.processDocumentAs(
         allocator,
         &x12_file,
         null,
         schema_handle.schema,
+        output_format,
     ) catch |err| {
         return @intFromEnum(errorToCode(err));
     };
 
-    // Get the data from ArrayList
-    const length = json_output.items.len;
+    return wrapOutput(allocator, &json_output, output_ptr);
+}
 
-    // Allocate buffer with room for null terminator
-    const data = allocator.alloc(u8, length + 1) catch {
-        json_output.deinit(allocator);
+/// Process a batch of X12 documents from memory with a pre-loaded schema
+///
+/// @param x12_data Array of `count` pointers to X12 data in memory
+/// @param x12_lengths Array of `count` X12 data lengths in bytes
+/// @param count Number of documents in the batch
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param outputs Array of `count` slots to receive the output handles
+/// @return 0 on success, error code of the first failing document otherwise
+///
+/// On success every slot holds an output handle that must be freed with
+/// zx12_free_output. On error no output handles are left allocated.
+///
+/// Example:
+///   const unsigned char* docs[2] = {doc1, doc2};
+///   size_t lengths[2] = {doc1_len, doc2_len};
+///   ZX12_Output* outputs[2];
+///   int result = zx12_process_from_memory_batch_with_schema(docs, lengths, 2, schema, outputs);
+///   if (result == 0) {
+///     for (int i = 0; i < 2; i++) {
+///       printf("%s\n", zx12_get_output(outputs[i]));
+///       zx12_free_output(outputs[i]);
+///     }
+///   }
+export fn zx12_process_from_memory_batch_with_schema(
+    x12_data: [*]const [*]const u8,
+    x12_lengths: [*]const usize,
+    count: usize,
+    schema: *ZX12_Schema,
+    outputs: [*]?*ZX12_Output,
+) c_int {
+    return zx12_process_from_memory_batch_with_schema_as(
+        x12_data,
+        x12_lengths,
+        count,
+        schema,
+        @intFromEnum(ZX12_Format.JsonPretty),
+        outputs,
+    );
+}
+
+/// Process a batch of X12 documents from memory with a pre-loaded schema in a chosen output format
+///
+/// @param x12_data Array of `count` pointers to X12 data in memory
+/// @param x12_lengths Array of `count` X12 data lengths in bytes
+/// @param count Number of documents in the batch
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param outputs Array of `count` slots to receive the output handles
+/// @return 0 on success, error code of the first failing document otherwise
+export fn zx12_process_from_memory_batch_with_schema_as(
+    x12_data: [*]const [*]const u8,
+    x12_lengths: [*]const usize,
+    count: usize,
+    schema: *ZX12_Schema,
+    format: c_int,
+    outputs: [*]?*ZX12_Output,
+) c_int {
+    for (0..count) |i| {
+        outputs[i] = null;
+        const result = zx12_process_from_memory_with_schema_as(x12_data[i], x12_lengths[i], schema, format, &outputs[i]);
+        if (result != @intFromEnum(ZX12_Error.Success)) {
+            // Release everything produced so far so the caller has nothing to free
+            for (outputs[0..i]) |output| {
+                zx12_free_output(output.?);
+            }
+            return result;
+        }
+    }
+    return @intFromEnum(ZX12_Error.Success);
+}
+
+/// Process a batch of X12 files with a pre-loaded schema
+///
+/// @param x12_file_paths Array of `count` paths to X12 files (null-terminated C strings)
+/// @param count Number of files in the batch
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param outputs Array of `count` slots to receive the output handles
+/// @return 0 on success, error code of the first failing file otherwise
+///
+/// On success every slot holds an output handle that must be freed with
+/// zx12_free_output. On error no output handles are left allocated.
+export fn zx12_process_document_batch_with_schema(
+    x12_file_paths: [*]const [*:0]const u8,
+    count: usize,
+    schema: *ZX12_Schema,
+    outputs: [*]?*ZX12_Output,
+) c_int {
+    return zx12_process_document_batch_with_schema_as(
+        x12_file_paths,
+        count,
+        schema,
+        @intFromEnum(ZX12_Format.JsonPretty),
+        outputs,
+    );
+}
+
+/// Process a batch of X12 files with a pre-loaded schema in a chosen output format
+///
+/// @param x12_file_paths Array of `count` paths to X12 files (null-terminated C strings)
+/// @param count Number of files in the batch
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param outputs Array of `count` slots to receive the output handles
+/// @return 0 on success, error code of the first failing file otherwise
+export fn zx12_process_document_batch_with_schema_as(
+    x12_file_paths: [*]const [*:0]const u8,
+    count: usize,
+    schema: *ZX12_Schema,
+    format: c_int,
+    outputs: [*]?*ZX12_Output,
+) c_int {
+    for (0..count) |i| {
+        outputs[i] = null;
+        const result = zx12_process_document_with_schema_as(x12_file_paths[i], schema, format, &outputs[i]);
+        if (result != @intFromEnum(ZX12_Error.Success)) {
+            // Release everything produced so far so the caller has nothing to free
+            for (outputs[0..i]) |output| {
+                zx12_free_output(output.?);
+            }
+            return result;
+        }
+    }
+    return @intFromEnum(ZX12_Error.Success);
+}
+
+/// Error code of the last *_r call made on the calling thread
+threadlocal var last_error: c_int = @intFromEnum(ZX12_Error.Success);
+
+/// Get the error code of the last *_r call made on the calling thread
+///
+/// @return 0 if that call succeeded, its error code otherwise
+export fn zx12_last_error() c_int {
+    return last_error;
+}
+
+/// Process an X12 document with a pre-loaded schema, returning the output handle
+///
+/// @param x12_file_path Path to the X12 file to process (null-terminated C string)
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @return Output handle on success, NULL on error (see zx12_last_error)
+///
+/// Example:
+///   ZX12_Output* output = zx12_process_document_with_schema_r("input.x12", schema, ZX12_FORMAT_JSON_COMPACT);
+///   if (output == NULL) {
+///     fprintf(stderr, "%s\n", zx12_get_error_message(zx12_last_error()));
+///   }
+export fn zx12_process_document_with_schema_r(
+    x12_file_path: [*:0]const u8,
+    schema: *ZX12_Schema,
+    format: c_int,
+) ?*ZX12_Output {
+    var output: ?*ZX12_Output = null;
+    last_error = zx12_process_document_with_schema_as(x12_file_path, schema, format, &output);
+    return output;
+}
+
+/// Process X12 data from memory with a pre-loaded schema, returning the output handle
+///
+/// @param x12_data Pointer to X12 data in memory
+/// @param x12_length Length of X12 data in bytes
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @return Output handle on success, NULL on error (see zx12_last_error)
+export fn zx12_process_from_memory_with_schema_r(
+    x12_data: [*]const u8,
+    x12_length: usize,
+    schema: *ZX12_Schema,
+    format: c_int,
+) ?*ZX12_Output {
+    var output: ?*ZX12_Output = null;
+    last_error = zx12_process_from_memory_with_schema_as(x12_data, x12_length, schema, format, &output);
+    return output;
+}
+
+// Internal structure of a processing context
+// Everything a *_ctx call allocates, parse data and output alike, comes from
+// the arena, and zx12_ctx_reset releases all of it at once
+const ContextHandle = struct {
+    arena: std.heap.ArenaAllocator,
+};
+
+/// Create a processing context for the *_ctx functions
+///
+/// @param ctx_ptr Pointer to receive the context handle (must not be null)
+/// @return 0 on success, error code otherwise
+///
+/// A context owns an arena that the *_ctx functions allocate from with a bump
+/// pointer. zx12_ctx_reset keeps the arena's memory for the next call, so a
+/// caller processing documents one after another makes no heap calls once
+/// the arena has grown to fit the largest one. A context must only be used
+/// by one thread at a time.
+///
+/// Example:
+///   ZX12_Context* ctx = NULL;
+///   zx12_ctx_create(&ctx);
+///   const char* data;
+///   size_t length;
+///   if (zx12_process_document_with_schema_ctx(ctx, "input.x12", schema, ZX12_FORMAT_JSON_COMPACT, &data, &length) == 0) {
+///     fwrite(data, 1, length, stdout);
+///   }
+///   zx12_ctx_reset(ctx);
+///   zx12_ctx_free(ctx);
+export fn zx12_ctx_create(ctx_ptr: *?*ZX12_Context) c_int {
+    const allocator = getGlobalAllocator();
+    const handle = allocator.create(ContextHandle) catch {
         return @intFromEnum(ZX12_Error.OutOfMemory);
     };
+    handle.* = .{ .arena = std.heap.ArenaAllocator.init(allocator) };
 
-    // Copy data and add null terminator
-    @memcpy(data[0..length], json_output.items);
-    data[length] = 0;
+    ctx_ptr.* = @ptrCast(handle);
+    return @intFromEnum(ZX12_Error.Success);
+}
 
-    // Free the ArrayList
-    json_output.deinit(allocator);
+/// Release everything allocated in a context, keeping its memory for reuse
+///
+/// @param ctx Context handle from zx12_ctx_create
+///
+/// Output returned by earlier *_ctx calls on this context becomes invalid.
+/// Call it after each *_ctx call, whether that call succeeded or not.
+export fn zx12_ctx_reset(ctx: *ZX12_Context) void {
+    const handle: *ContextHandle = @ptrCast(@alignCast(ctx));
+    _ = handle.arena.reset(.retain_capacity);
+}
 
-    // Create output handle
-    const handle = allocator.create(OutputHandle) catch {
-        allocator.free(data);
-        return @intFromEnum(ZX12_Error.OutOfMemory);
+/// Free a context and all of its memory
+///
+/// @param ctx Context handle from zx12_ctx_create
+export fn zx12_ctx_free(ctx: *ZX12_Context) void {
+    const allocator = getGlobalAllocator();
+    const handle: *ContextHandle = @ptrCast(@alignCast(ctx));
+    handle.arena.deinit();
+    allocator.destroy(handle);
+}
+
+/// Process an X12 file with a pre-loaded schema into a context's arena
+///
+/// @param ctx Context handle from zx12_ctx_create
+/// @param x12_file_path Path to the X12 file to process (null-terminated C string)
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param data_ptr Pointer to receive the null-terminated output data
+/// @param length_ptr Pointer to receive the output length in bytes (excluding null terminator)
+/// @return 0 on success, error code otherwise
+///
+/// The output is valid until the next zx12_ctx_reset or zx12_ctx_free on ctx
+/// and is not freed separately.
+export fn zx12_process_document_with_schema_ctx(
+    ctx: *ZX12_Context,
+    x12_file_path: [*:0]const u8,
+    schema: *ZX12_Schema,
+    format: c_int,
+    data_ptr: *?[*:0]const u8,
+    length_ptr: *usize,
+) c_int {
+    var x12_file = X12_File{ .file_contents = null, .file_path = std.mem.span(x12_file_path) };
+    return processInContext(ctx, &x12_file, schema, format, data_ptr, length_ptr);
+}
+
+/// Process X12 data from memory with a pre-loaded schema into a context's arena
+///
+/// @param ctx Context handle from zx12_ctx_create
+/// @param x12_data Pointer to X12 data in memory
+/// @param x12_length Length of X12 data in bytes
+/// @param schema Pre-loaded schema handle from zx12_load_schema
+/// @param format Output format, one of ZX12_Format
+/// @param data_ptr Pointer to receive the null-terminated output data
+/// @param length_ptr Pointer to receive the output length in bytes (excluding null terminator)
+/// @return 0 on success, error code otherwise
+export fn zx12_process_from_memory_with_schema_ctx(
+    ctx: *ZX12_Context,
+    x12_data: [*]const u8,
+    x12_length: usize,
+    schema: *ZX12_Schema,
+    format: c_int,
+    data_ptr: *?[*:0]const u8,
+    length_ptr: *usize,
+) c_int {
+    var x12_file = X12_File{ .file_contents = @constCast(x12_data[0..x12_length]), .file_path = null };
+    return processInContext(ctx, &x12_file, schema, format, data_ptr, length_ptr);
+}
+
+/// Process a document with every allocation, output included, made in the context's arena
+fn processInContext(
+    ctx: *ZX12_Context,
+    x12_file: *X12_File,
+    schema: *ZX12_Schema,
+    format: c_int,
+    data_ptr: *?[*:0]const u8,
+    length_ptr: *usize,
+) c_int {
+    const output_format = formatFromCode(format) orelse return @intFromEnum(ZX12_Error.InvalidArgument);
+    const handle: *ContextHandle = @ptrCast(@alignCast(ctx));
+    const schema_handle: *SchemaHandle = @ptrCast(@alignCast(schema));
+    const arena = handle.arena.allocator();
+
+    var json_output = document_processor.processDocumentIn(
+        arena,
+        arena,
+        x12_file,
+        null,
+        schema_handle.schema,
+        output_format,
+    ) catch |err| {
+        return @intFromEnum(errorToCode(err));
     };
 
-    handle.* = .{
-        .data = data,
-        .length = length,
+    const length = json_output.items.len;
+    // Null-terminate like the output handles; the arena frees it on reset
+    json_output.append(arena, 0) catch {
+        return @intFromEnum(ZX12_Error.OutOfMemory);
     };
 
-    output_ptr.* = @ptrCast(handle);
+    data_ptr.* = @ptrCast(json_output.items.ptr);
+    length_ptr.* = length;
     return @intFromEnum(ZX12_Error.Success);
 }
 
@@ -396,6 +747,50 @@ export fn zx12_load_schema(
         return @intFromEnum(errorToCode(err));
     };
 
+    return wrapSchema(allocator, schema, schema_ptr);
+}
+
+/// Load an X12 schema from JSON held in memory
+///
+/// @param schema_data Pointer to the schema JSON in memory
+/// @param schema_length Length of the schema JSON in bytes
+/// @param schema_ptr Pointer to receive the schema handle (must not be null)
+/// @return 0 on success, ZX12_SCHEMA_LOAD_ERROR for malformed or invalid schema JSON,
+///         other error code otherwise
+///
+/// The JSON is copied into the schema, so the buffer may be released as soon
+/// as this function returns.
+///
+/// Example:
+///   ZX12_Schema* schema = NULL;
+///   int result = zx12_load_schema_from_memory(schema_json, schema_json_len, &schema);
+///   if (result == 0) {
+///     // Use schema...
+///     zx12_free_schema(schema);
+///   }
+export fn zx12_load_schema_from_memory(
+    schema_data: [*]const u8,
+    schema_length: usize,
+    schema_ptr: *?*ZX12_Schema,
+) c_int {
+    const allocator = getGlobalAllocator();
+
+    // Load the schema
+    const schema = schema_load_from_slice(allocator, schema_data[0..schema_length]) catch |err| {
+        std.log.err("Error loading schema: {}", .{err});
+        return @intFromEnum(errorToCode(err));
+    };
+
+    return wrapSchema(allocator, schema, schema_ptr);
+}
+
+/// Wrap a loaded schema in a schema handle
+/// Takes ownership of schema; it is freed if the handle cannot be created
+fn wrapSchema(
+    allocator: std.mem.Allocator,
+    schema: Schema,
+    schema_ptr: *?*ZX12_Schema,
+) c_int {
     // Create schema handle
     const handle = allocator.create(SchemaHandle) catch {
         // If we can't allocate the handle, we need to deinit the schema
@@ -442,6 +837,50 @@ test "C API error messages" {
     try std.testing.expect(msg_slice.len > 0);
 }
 
+test "C API context reuses its arena across calls" {
+    var schema: ?*ZX12_Schema = null;
+    try std.testing.expectEqual(@as(c_int, 0), zx12_load_schema("schema/837p.json", &schema));
+    defer zx12_free_schema(schema.?);
+
+    var ctx: ?*ZX12_Context = null;
+    try std.testing.expectEqual(@as(c_int, 0), zx12_ctx_create(&ctx));
+    defer zx12_ctx_free(ctx.?);
+
+    var expected: ?*ZX12_Output = null;
+    try std.testing.expectEqual(@as(c_int, 0), zx12_process_document_with_schema_as(
+        "samples/837p_example.x12",
+        schema.?,
+        @intFromEnum(ZX12_Format.JsonCompact),
+        &expected,
+    ));
+    defer zx12_free_output(expected.?);
+    var expected_length: usize = 0;
+    const expected_data = zx12_get_output_data(expected.?, &expected_length);
+
+    for (0..2) |_| {
+        var data: ?[*:0]const u8 = null;
+        var length: usize = 0;
+        try std.testing.expectEqual(@as(c_int, 0), zx12_process_document_with_schema_ctx(
+            ctx.?,
+            "samples/837p_example.x12",
+            schema.?,
+            @intFromEnum(ZX12_Format.JsonCompact),
+            &data,
+            &length,
+        ));
+        try std.testing.expectEqualStrings(expected_data[0..expected_length], data.?[0..length]);
+        zx12_ctx_reset(ctx.?);
+    }
+
+    var data: ?[*:0]const u8 = null;
+    var length: usize = 0;
+    try std.testing.expectEqual(
+        @as(c_int, @intFromEnum(ZX12_Error.InvalidISA)),
+        zx12_process_from_memory_with_schema_ctx(ctx.?, "not x12", 7, schema.?, 0, &data, &length),
+    );
+    zx12_ctx_reset(ctx.?);
+}
+
 pub fn main() !void {
     const allocator = std.heap.c_allocator;
     // Load schema
@@ -13,6 +13,7 @@ const JsonBuilder = json_builder.JsonBuilder;
 const JsonValue = json_builder.JsonValue;
 const JsonObject = json_builder.JsonObject;
 const JsonArray = json_builder.JsonArray;
+pub const OutputFormat = json_builder.OutputFormat;
 
 pub const X12_File = struct {
     file_path: ?[]const u8,
@@ -77,10 +78,34 @@ pub fn processDocument(
     x12_file: *X12_File,
     schema_path: ?[]const u8,
     schema: ?Schema,
+) !std.ArrayList(u8) {
+    return processDocumentAs(allocator, x12_file, schema_path, schema, .json_pretty);
+}
+
+/// Process X12 document and serialize it in the given output format
+pub fn processDocumentAs(
+    allocator: std.mem.Allocator,
+    x12_file: *X12_File,
+    schema_path: ?[]const u8,
+    schema: ?Schema,
+    format: OutputFormat,
 ) !std.ArrayList(u8) {
     var arena = std.heap.ArenaAllocator.init(std.heap.c_allocator);
     defer arena.deinit();
-    const parser_allocator = arena.allocator();
+    return processDocumentIn(arena.allocator(), allocator, x12_file, schema_path, schema, format);
+}
+
+/// Process X12 document, allocating everything but the output from parser_allocator
+/// Intermediate data is not freed piece by piece, so parser_allocator should be
+/// an arena; it may be the same allocator as the output's
+pub fn processDocumentIn(
+    parser_allocator: std.mem.Allocator,
+    allocator: std.mem.Allocator,
+    x12_file: *X12_File,
+    schema_path: ?[]const u8,
+    schema: ?Schema,
+    format: OutputFormat,
+) !std.ArrayList(u8) {
     defer x12_file.deinit(parser_allocator);
     // Parse X12 document
     if (x12_file.file_contents == null and x12_file.file_path != null) {
@@ -119,9 +144,9 @@ pub fn processDocument(
     try processHierarchy(&builder, &tree, &document, &schema_to_use.?, &boundary_segments, parser_allocator);
     try processTrailer(&builder, &document, &schema_to_use.?, parser_allocator);
 
-    // Stringify JSON
+    // Serialize output
     var output = try std.ArrayList(u8).initCapacity(allocator, 1);
-    try builder.stringify(&output, allocator); //<--Use the callers allocator here so they own memorys
+    try builder.serialize(&output, allocator, format); //<--Use the callers allocator here so they own memorys
 
     if (schema == null) {
         // Only deinit schema if it was loaded by this function
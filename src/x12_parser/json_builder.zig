@@ -1,6 +1,16 @@
 const std = @import("std");
 const testing = std.testing;
 
+/// Serialized output formats
+pub const OutputFormat = enum {
+    /// Indented JSON, two spaces per level
+    json_pretty,
+    /// JSON without any insignificant whitespace
+    json_compact,
+    /// MessagePack, with integral numbers encoded as integers
+    msgpack,
+};
+
 /// JSON value types
 pub const JsonValue = union(enum) {
     null_value: void,
@@ -221,7 +231,22 @@ pub const JsonBuilder = struct {
         try self.stringifyObject(&self.root, output, allocator, 0);
     }
 
-    fn stringifyValue(self: *const JsonBuilder, value: *const JsonValue, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: usize) std.mem.Allocator.Error!void {
+    /// Convert to JSON string without indentation or newlines
+    pub fn stringifyCompact(self: *const JsonBuilder, output: *std.ArrayList(u8), allocator: std.mem.Allocator) !void {
+        try self.stringifyObject(&self.root, output, allocator, null);
+    }
+
+    /// Serialize in the requested output format
+    pub fn serialize(self: *const JsonBuilder, output: *std.ArrayList(u8), allocator: std.mem.Allocator, format: OutputFormat) !void {
+        switch (format) {
+            .json_pretty => try self.stringify(output, allocator),
+            .json_compact => try self.stringifyCompact(output, allocator),
+            .msgpack => try self.writeMsgpackObject(&self.root, output, allocator),
+        }
+    }
+
+    // A null indent selects compact output throughout
+    fn stringifyValue(self: *const JsonBuilder, value: *const JsonValue, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: ?usize) std.mem.Allocator.Error!void {
         switch (value.*) {
             .null_value => try output.appendSlice(allocator, "null"),
             .bool_value => |b| try output.appendSlice(allocator, if (b) "true" else "false"),
@@ -249,43 +274,131 @@ pub const JsonBuilder = struct {
         }
     }
 
-    fn stringifyObject(self: *const JsonBuilder, obj: *const JsonObject, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: usize) std.mem.Allocator.Error!void {
-        try output.appendSlice(allocator, "{\n");
+    fn stringifyObject(self: *const JsonBuilder, obj: *const JsonObject, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: ?usize) std.mem.Allocator.Error!void {
+        try output.appendSlice(allocator, if (indent != null) "{\n" else "{");
 
         var iter = obj.fields.iterator();
         var first = true;
         while (iter.next()) |entry| {
-            if (!first) try output.appendSlice(allocator, ",\n");
+            if (!first) try output.appendSlice(allocator, if (indent != null) ",\n" else ",");
             first = false;
 
-            try self.writeIndent(output, allocator, indent + 1);
+            if (indent) |level| try self.writeIndent(output, allocator, level + 1);
             try output.append(allocator, '"');
             try output.appendSlice(allocator, entry.key_ptr.*);
-            try output.appendSlice(allocator, "\": ");
+            try output.appendSlice(allocator, if (indent != null) "\": " else "\":");
 
-            try self.stringifyValue(entry.value_ptr, output, allocator, indent + 1);
+            try self.stringifyValue(entry.value_ptr, output, allocator, nextIndent(indent));
         }
 
-        try output.append(allocator, '\n');
-        try self.writeIndent(output, allocator, indent);
+        if (indent) |level| {
+            try output.append(allocator, '\n');
+            try self.writeIndent(output, allocator, level);
+        }
         try output.append(allocator, '}');
     }
 
-    fn stringifyArray(self: *const JsonBuilder, arr: *const JsonArray, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: usize) std.mem.Allocator.Error!void {
-        try output.appendSlice(allocator, "[\n");
+    fn stringifyArray(self: *const JsonBuilder, arr: *const JsonArray, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: ?usize) std.mem.Allocator.Error!void {
+        try output.appendSlice(allocator, if (indent != null) "[\n" else "[");
 
         for (arr.items.items, 0..) |*item, i| {
-            if (i > 0) try output.appendSlice(allocator, ",\n");
+            if (i > 0) try output.appendSlice(allocator, if (indent != null) ",\n" else ",");
 
-            try self.writeIndent(output, allocator, indent + 1);
-            try self.stringifyValue(item, output, allocator, indent + 1);
+            if (indent) |level| try self.writeIndent(output, allocator, level + 1);
+            try self.stringifyValue(item, output, allocator, nextIndent(indent));
         }
 
-        try output.append(allocator, '\n');
-        try self.writeIndent(output, allocator, indent);
+        if (indent) |level| {
+            try output.append(allocator, '\n');
+            try self.writeIndent(output, allocator, level);
+        }
         try output.append(allocator, ']');
     }
 
+    fn nextIndent(indent: ?usize) ?usize {
+        return if (indent) |level| level + 1 else null;
+    }
+
+    fn writeMsgpackValue(self: *const JsonBuilder, value: *const JsonValue, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        switch (value.*) {
+            .null_value => try output.append(allocator, 0xc0),
+            .bool_value => |b| try output.append(allocator, if (b) 0xc3 else 0xc2),
+            .number => |n| try writeMsgpackNumber(n, output, allocator),
+            .string => |s| try writeMsgpackString(s, output, allocator),
+            .array => |arr| {
+                try writeMsgpackLength(arr.items.items.len, 0x90, 0xdc, output, allocator);
+                for (arr.items.items) |*item| {
+                    try self.writeMsgpackValue(item, output, allocator);
+                }
+            },
+            .object => |obj| try self.writeMsgpackObject(obj, output, allocator),
+        }
+    }
+
+    fn writeMsgpackObject(self: *const JsonBuilder, obj: *const JsonObject, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        try writeMsgpackLength(obj.fields.count(), 0x80, 0xde, output, allocator);
+
+        var iter = obj.fields.iterator();
+        while (iter.next()) |entry| {
+            try writeMsgpackString(entry.key_ptr.*, output, allocator);
+            try self.writeMsgpackValue(entry.value_ptr, output, allocator);
+        }
+    }
+
+    /// Write an array or map header: the fix form below 16 entries, else the
+    /// 16-bit form (tag16) or the 32-bit form that follows it
+    fn writeMsgpackLength(len: usize, fix_tag: u8, tag16: u8, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        if (len < 16) {
+            try output.append(allocator, fix_tag | @as(u8, @intCast(len)));
+        } else if (len <= std.math.maxInt(u16)) {
+            try output.append(allocator, tag16);
+            try writeBigEndian(u16, @intCast(len), output, allocator);
+        } else {
+            try output.append(allocator, tag16 + 1);
+            try writeBigEndian(u32, @intCast(len), output, allocator);
+        }
+    }
+
+    fn writeMsgpackString(s: []const u8, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        if (s.len < 32) {
+            try output.append(allocator, 0xa0 | @as(u8, @intCast(s.len)));
+        } else if (s.len <= std.math.maxInt(u8)) {
+            try output.append(allocator, 0xd9);
+            try output.append(allocator, @intCast(s.len));
+        } else if (s.len <= std.math.maxInt(u16)) {
+            try output.append(allocator, 0xda);
+            try writeBigEndian(u16, @intCast(s.len), output, allocator);
+        } else {
+            try output.append(allocator, 0xdb);
+            try writeBigEndian(u32, @intCast(s.len), output, allocator);
+        }
+        try output.appendSlice(allocator, s);
+    }
+
+    fn writeMsgpackNumber(n: f64, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        // Integral values become integers so they decode the same as from JSON
+        if (@floor(n) == n and @abs(n) < 0x1p63) {
+            const i: i64 = @intFromFloat(n);
+            if (i >= 0 and i < 128) {
+                try output.append(allocator, @intCast(i));
+            } else if (i < 0 and i >= -32) {
+                try output.append(allocator, @bitCast(@as(i8, @intCast(i))));
+            } else {
+                try output.append(allocator, 0xd3);
+                try writeBigEndian(i64, i, output, allocator);
+            }
+        } else {
+            try output.append(allocator, 0xcb);
+            try writeBigEndian(u64, @bitCast(n), output, allocator);
+        }
+    }
+
+    fn writeBigEndian(comptime T: type, value: T, output: *std.ArrayList(u8), allocator: std.mem.Allocator) std.mem.Allocator.Error!void {
+        var buf: [@sizeOf(T)]u8 = undefined;
+        std.mem.writeInt(T, &buf, value, .big);
+        try output.appendSlice(allocator, &buf);
+    }
+
     fn writeIndent(self: *const JsonBuilder, output: *std.ArrayList(u8), allocator: std.mem.Allocator, indent: usize) std.mem.Allocator.Error!void {
         _ = self;
         var i: usize = 0;
@@ -455,3 +568,36 @@ test "stringify with array" {
     try testing.expect(std.mem.indexOf(u8, json, "\"Provider 1\"") != null);
     try testing.expect(std.mem.indexOf(u8, json, "\"Provider 2\"") != null);
 }
+
+test "stringify compact" {
+    const allocator = testing.allocator;
+    var builder = JsonBuilder.init(allocator);
+    defer builder.deinit();
+
+    const first_str = try allocator.dupe(u8, "John");
+    try builder.set("person.name.first", JsonValue{ .string = first_str });
+
+    var output = try std.ArrayList(u8).initCapacity(allocator, 1);
+    defer output.deinit(allocator);
+
+    try builder.serialize(&output, allocator, .json_compact);
+
+    try testing.expectEqualStrings("{\"person\":{\"name\":{\"first\":\"John\"}}}", output.items);
+}
+
+test "serialize msgpack" {
+    const allocator = testing.allocator;
+    var builder = JsonBuilder.init(allocator);
+    defer builder.deinit();
+
+    const first_str = try allocator.dupe(u8, "John");
+    try builder.set("person.first", JsonValue{ .string = first_str });
+
+    var output = try std.ArrayList(u8).initCapacity(allocator, 1);
+    defer output.deinit(allocator);
+
+    try builder.serialize(&output, allocator, .msgpack);
+
+    // {"person": {"first": "John"}}
+    try testing.expectEqualSlices(u8, "\x81\xa6person\x81\xa5first\xa4John", output.items);
+}
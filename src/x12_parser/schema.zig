@@ -328,35 +328,80 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
     var io_threaded = std.Io.Threaded.init(allocator, .{});
     // Read file
     const content = try std.Io.Dir.cwd().readFileAlloc(io_threaded.io(), file_path, allocator, @enumFromInt(10 * 1024 * 1024)); // 10MB max
+    return parseSchema(allocator, content);
+}
+
+/// Load schema from JSON already held in memory
+/// The JSON is copied, so the caller may free it once this returns
+pub fn loadSchemaFromSlice(allocator: std.mem.Allocator, json: []const u8) !Schema {
+    const content = try allocator.dupe(u8, json);
+    return parseSchema(allocator, content);
+}
+
+/// JSON value types a schema field can be required to have
+const JsonKind = @typeInfo(std.json.Value).@"union".tag_type.?;
+
+/// Payload type of a JSON value of the given kind
+fn JsonPayload(comptime kind: JsonKind) type {
+    return @FieldType(std.json.Value, @tagName(kind));
+}
+
+/// Unwrap a JSON value, failing with InvalidSchema if it has another type
+fn expectKind(value: std.json.Value, comptime kind: JsonKind) !JsonPayload(kind) {
+    if (value != kind) return error.InvalidSchema;
+    return @field(value, @tagName(kind));
+}
+
+/// Get a required field of a schema object
+fn requireField(obj: std.json.ObjectMap, key: []const u8, comptime kind: JsonKind) !JsonPayload(kind) {
+    return expectKind(obj.get(key) orelse return error.InvalidSchema, kind);
+}
+
+/// Get an optional field of a schema object, null when it is absent
+fn optionalField(obj: std.json.ObjectMap, key: []const u8, comptime kind: JsonKind) !?JsonPayload(kind) {
+    const value = obj.get(key) orelse return null;
+    return try expectKind(value, kind);
+}
+
+/// Unwrap a JSON integer used as a position or count
+fn expectIndex(value: std.json.Value) !usize {
+    return std.math.cast(usize, try expectKind(value, .integer)) orelse error.InvalidSchema;
+}
+
+/// Build a schema from JSON content, taking ownership of the content
+/// Returns error.InvalidSchema if the JSON is malformed or lacks a required field
+fn parseSchema(allocator: std.mem.Allocator, content: []const u8) !Schema {
     // Don't free content - we need it for string references
     // It will be kept alive during schema lifetime
+    errdefer allocator.free(content);
 
     // Parse JSON
-    const parsed = try std.json.parseFromSlice(std.json.Value, allocator, content, .{});
+    const parsed = std.json.parseFromSlice(std.json.Value, allocator, content, .{}) catch |err| switch (err) {
+        error.OutOfMemory => return error.OutOfMemory,
+        else => return error.InvalidSchema,
+    };
     // Don't defer parsed.deinit() - keep it alive with the schema
+    errdefer parsed.deinit();
 
-    const root = parsed.value.object; // Extract transaction info
-    const transaction = root.get("transaction").?.object;
-    const schema_version = root.get("schema_version").?.string;
-    const transaction_id = transaction.get("id").?.string;
-    const transaction_version = transaction.get("version").?.string;
-    const transaction_type = transaction.get("type").?.string;
-    const description = transaction.get("description").?.string;
+    const root = try expectKind(parsed.value, .object); // Extract transaction info
+    const transaction = try requireField(root, "transaction", .object);
+    const schema_version = try requireField(root, "schema_version", .string);
+    const transaction_id = try requireField(transaction, "id", .string);
+    const transaction_version = try requireField(transaction, "version", .string);
+    const transaction_type = try requireField(transaction, "type", .string);
+    const description = try requireField(transaction, "description", .string);
 
     // Parse definitions (if present)
     var definitions = Definitions.init(allocator);
     errdefer definitions.deinit();
 
-    if (root.get("definitions")) |defs_value| {
-        const defs_obj = defs_value.object;
-
+    if (try optionalField(root, "definitions", .object)) |defs_obj| {
         // Parse loop definitions
-        if (defs_obj.get("loops")) |loops_value| {
-            const loops_obj = loops_value.object;
+        if (try optionalField(defs_obj, "loops", .object)) |loops_obj| {
             var loops_iter = loops_obj.iterator();
             while (loops_iter.next()) |entry| {
                 const loop_name = entry.key_ptr.*;
-                const loop_obj = entry.value_ptr.*.object;
+                const loop_obj = try expectKind(entry.value_ptr.*, .object);
                 // Don't pass definitions when parsing definitions themselves
                 const loop = try parseNonHierarchicalLoop(allocator, loop_obj, null);
                 try definitions.loops.put(loop_name, loop);
@@ -364,12 +409,11 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
         }
 
         // Parse segment definitions
-        if (defs_obj.get("segments")) |segments_value| {
-            const segments_obj = segments_value.object;
+        if (try optionalField(defs_obj, "segments", .object)) |segments_obj| {
             var segments_iter = segments_obj.iterator();
             while (segments_iter.next()) |entry| {
                 const seg_name = entry.key_ptr.*;
-                const seg_obj = entry.value_ptr.*.object;
+                const seg_obj = try expectKind(entry.value_ptr.*, .object);
                 const seg = try parseSegment(allocator, seg_obj, null);
                 try definitions.segments.put(seg_name, seg);
             }
@@ -377,8 +421,8 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
     }
 
     // Parse header segments
-    const header_obj = root.get("transaction_header").?.object;
-    const header_segments_json = header_obj.get("segments").?.array;
+    const header_obj = try requireField(root, "transaction_header", .object);
+    const header_segments_json = try requireField(header_obj, "segments", .array);
     const header_segments = try parseSegments(allocator, header_segments_json.items);
     errdefer {
         for (header_segments) |*seg| {
@@ -389,16 +433,16 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
 
     // Parse sequential sections
     var sequential_sections: []SequentialSection = &[_]SequentialSection{};
-    if (root.get("sequential_sections")) |seq_array| {
-        const sections_json = seq_array.array.items;
+    if (try optionalField(root, "sequential_sections", .array)) |seq_array| {
+        const sections_json = seq_array.items;
         sequential_sections = try allocator.alloc(SequentialSection, sections_json.len);
         errdefer allocator.free(sequential_sections);
 
         for (sections_json, 0..) |section_value, i| {
-            const section_obj = section_value.object;
-            const name = section_obj.get("name").?.string;
-            const output_path = section_obj.get("output_path").?.string;
-            const segments_json = section_obj.get("segments").?.array.items;
+            const section_obj = try expectKind(section_value, .object);
+            const name = try requireField(section_obj, "name", .string);
+            const output_path = try requireField(section_obj, "output_path", .string);
+            const segments_json = (try requireField(section_obj, "segments", .array)).items;
             const segments = try parseSegments(allocator, segments_json);
 
             sequential_sections[i] = SequentialSection{
@@ -417,9 +461,9 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
     }
 
     // Parse hierarchical structure
-    const hier_obj = root.get("hierarchical_structure").?.object;
-    const hier_output_array = hier_obj.get("output_array").?.string;
-    const levels_obj = hier_obj.get("levels").?.object;
+    const hier_obj = try requireField(root, "hierarchical_structure", .object);
+    const hier_output_array = try requireField(hier_obj, "output_array", .string);
+    const levels_obj = try requireField(hier_obj, "levels", .object);
 
     var hl_levels = std.StringHashMap(HLLevel).init(allocator);
     errdefer {
@@ -434,15 +478,15 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
     var levels_iter = levels_obj.iterator();
     while (levels_iter.next()) |entry| {
         const level_code = entry.key_ptr.*;
-        const level_obj = entry.value_ptr.*.object;
+        const level_obj = try expectKind(entry.value_ptr.*, .object);
 
         const level = try parseHLLevel(allocator, level_code, level_obj, &definitions);
         try hl_levels.put(level_code, level);
     }
 
     // Parse trailer segments
-    const trailer_obj = root.get("transaction_trailer").?.object;
-    const trailer_segments_json = trailer_obj.get("segments").?.array;
+    const trailer_obj = try requireField(root, "transaction_trailer", .object);
+    const trailer_segments_json = try requireField(trailer_obj, "segments", .array);
     const trailer_segments = try parseSegments(allocator, trailer_segments_json.items);
     errdefer {
         for (trailer_segments) |*seg| {
@@ -471,9 +515,9 @@ pub fn loadSchema(allocator: std.mem.Allocator, file_path: []const u8) !Schema {
 
 /// Parse HL level from JSON
 fn parseHLLevel(allocator: std.mem.Allocator, level_code: []const u8, level_obj: std.json.ObjectMap, definitions: *const Definitions) !HLLevel {
-    const name = level_obj.get("name").?.string;
-    const output_array = if (level_obj.get("output_array")) |arr| arr.string else null;
-    const segments_json = level_obj.get("segments").?.array;
+    const name = try requireField(level_obj, "name", .string);
+    const output_array = try optionalField(level_obj, "output_array", .string);
+    const segments_json = try requireField(level_obj, "segments", .array);
 
     const segments = try parseSegmentsWithDefs(allocator, segments_json.items, definitions);
     errdefer {
@@ -484,24 +528,23 @@ fn parseHLLevel(allocator: std.mem.Allocator, level_code: []const u8, level_obj:
     }
 
     var child_levels: ?[]const []const u8 = null;
-    if (level_obj.get("child_levels")) |child_arr| {
-        const children_json = child_arr.array;
+    if (try optionalField(level_obj, "child_levels", .array)) |children_json| {
         const children = try allocator.alloc([]const u8, children_json.items.len);
+        errdefer allocator.free(children);
         for (children_json.items, 0..) |item, i| {
-            children[i] = item.string;
+            children[i] = try expectKind(item, .string);
         }
         child_levels = children;
     }
 
     // Parse non-hierarchical loops if present
     var non_hierarchical_loops: []NonHierarchicalLoop = &[_]NonHierarchicalLoop{};
-    if (level_obj.get("non_hierarchical_loops")) |loops_arr| {
-        const loops_json = loops_arr.array;
+    if (try optionalField(level_obj, "non_hierarchical_loops", .array)) |loops_json| {
         const loops = try allocator.alloc(NonHierarchicalLoop, loops_json.items.len);
         errdefer allocator.free(loops);
 
         for (loops_json.items, 0..) |loop_value, i| {
-            loops[i] = try parseNonHierarchicalLoop(allocator, loop_value.object, definitions);
+            loops[i] = try parseNonHierarchicalLoop(allocator, try expectKind(loop_value, .object), definitions);
         }
         non_hierarchical_loops = loops;
     }
@@ -520,8 +563,7 @@ fn parseHLLevel(allocator: std.mem.Allocator, level_code: []const u8, level_obj:
 /// Parse non-hierarchical loop from JSON
 fn parseNonHierarchicalLoop(allocator: std.mem.Allocator, loop_obj: std.json.ObjectMap, definitions: ?*const Definitions) !NonHierarchicalLoop {
     // Check if this is a reference
-    if (loop_obj.get("$ref")) |ref_value| {
-        const ref_path = ref_value.string;
+    if (try optionalField(loop_obj, "$ref", .string)) |ref_path| {
         // Parse reference path like "#/definitions/loops/claim_loop_2300"
         if (std.mem.startsWith(u8, ref_path, "#/definitions/loops/")) {
             const loop_name = ref_path["#/definitions/loops/".len..];
@@ -531,11 +573,11 @@ fn parseNonHierarchicalLoop(allocator: std.mem.Allocator, loop_obj: std.json.Obj
                     var cloned_loop = try cloneNonHierarchicalLoop(allocator, base_loop);
 
                     // Apply overrides from loop_obj
-                    if (loop_obj.get("name")) |name_override| {
-                        cloned_loop.name = name_override.string;
+                    if (try optionalField(loop_obj, "name", .string)) |name_override| {
+                        cloned_loop.name = name_override;
                     }
-                    if (loop_obj.get("output_array")) |output_override| {
-                        cloned_loop.output_array = output_override.string;
+                    if (try optionalField(loop_obj, "output_array", .string)) |output_override| {
+                        cloned_loop.output_array = output_override;
                     }
 
                     return cloned_loop;
@@ -546,10 +588,10 @@ fn parseNonHierarchicalLoop(allocator: std.mem.Allocator, loop_obj: std.json.Obj
     }
 
     // When parsing definitions, name and output_array are optional
-    const name = if (loop_obj.get("name")) |n| n.string else "";
-    const trigger = loop_obj.get("trigger").?.string;
-    const output_array = if (loop_obj.get("output_array")) |o| o.string else "";
-    const segments_json = loop_obj.get("segments").?.array;
+    const name = (try optionalField(loop_obj, "name", .string)) orelse "";
+    const trigger = try requireField(loop_obj, "trigger", .string);
+    const output_array = (try optionalField(loop_obj, "output_array", .string)) orelse "";
+    const segments_json = try requireField(loop_obj, "segments", .array);
 
     const segments = try parseSegmentsWithDefs(allocator, segments_json.items, definitions);
     errdefer {
@@ -561,13 +603,12 @@ fn parseNonHierarchicalLoop(allocator: std.mem.Allocator, loop_obj: std.json.Obj
 
     // Parse nested loops if present
     var nested_loops: []NonHierarchicalLoop = &[_]NonHierarchicalLoop{};
-    if (loop_obj.get("nested_loops")) |nested_arr| {
-        const nested_json = nested_arr.array;
+    if (try optionalField(loop_obj, "nested_loops", .array)) |nested_json| {
         const nested = try allocator.alloc(NonHierarchicalLoop, nested_json.items.len);
         errdefer allocator.free(nested);
 
         for (nested_json.items, 0..) |nested_value, i| {
-            nested[i] = try parseNonHierarchicalLoop(allocator, nested_value.object, definitions);
+            nested[i] = try parseNonHierarchicalLoop(allocator, try expectKind(nested_value, .object), definitions);
         }
         nested_loops = nested;
     }
@@ -593,7 +634,7 @@ fn parseSegmentsWithDefs(allocator: std.mem.Allocator, segments_json: []const st
     errdefer allocator.free(segments);
 
     for (segments_json, 0..) |seg_value, i| {
-        const seg_obj = seg_value.object;
+        const seg_obj = try expectKind(seg_value, .object);
         segments[i] = try parseSegment(allocator, seg_obj, definitions);
     }
 
@@ -603,8 +644,7 @@ fn parseSegmentsWithDefs(allocator: std.mem.Allocator, segments_json: []const st
 /// Parse single segment from JSON
 fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, definitions: ?*const Definitions) !SegmentDef {
     // Check if this is a reference
-    if (seg_obj.get("$ref")) |ref_value| {
-        const ref_path = ref_value.string;
+    if (try optionalField(seg_obj, "$ref", .string)) |ref_path| {
         // Parse reference path like "#/definitions/segments/standard_nm1_billing"
         if (std.mem.startsWith(u8, ref_path, "#/definitions/segments/")) {
             const seg_name = ref_path["#/definitions/segments/".len..];
@@ -616,14 +656,14 @@ fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, defin
                     // Apply overrides from seg_obj
                     // Note: qualifier and group are complex structures that should not be overridden via reference
                     // If needed, they should be defined in the base definition
-                    if (seg_obj.get("optional")) |optional_override| {
-                        cloned_seg.optional = optional_override.bool;
+                    if (try optionalField(seg_obj, "optional", .bool)) |optional_override| {
+                        cloned_seg.optional = optional_override;
                     }
-                    if (seg_obj.get("multiple")) |multiple_override| {
-                        cloned_seg.multiple = multiple_override.bool;
+                    if (try optionalField(seg_obj, "multiple", .bool)) |multiple_override| {
+                        cloned_seg.multiple = multiple_override;
                     }
                     if (seg_obj.get("max_use")) |max_use_override| {
-                        cloned_seg.max_use = @intCast(max_use_override.integer);
+                        cloned_seg.max_use = try expectIndex(max_use_override);
                     }
 
                     return cloned_seg;
@@ -632,14 +672,14 @@ fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, defin
         }
         return error.InvalidReference;
     }
-    const id = seg_obj.get("id").?.string;
-    const optional = if (seg_obj.get("optional")) |opt| opt.bool else false;
-    const multiple = if (seg_obj.get("multiple")) |mult| mult.bool else false;
+    const id = try requireField(seg_obj, "id", .string);
+    const optional = (try optionalField(seg_obj, "optional", .bool)) orelse false;
+    const multiple = (try optionalField(seg_obj, "multiple", .bool)) orelse false;
 
     // Parse qualifier
     var qualifier: ?[]const []const u8 = null;
-    if (seg_obj.get("qualifier")) |qual_arr| {
-        const qual_items = qual_arr.array.items;
+    if (try optionalField(seg_obj, "qualifier", .array)) |qual_arr| {
+        const qual_items = qual_arr.items;
         const qual = try allocator.alloc([]const u8, qual_items.len);
         errdefer allocator.free(qual);
         for (qual_items, 0..) |item, i| {
@@ -654,24 +694,25 @@ fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, defin
 
     // Parse group
     var group: ?[]const []const u8 = null;
-    if (seg_obj.get("group")) |grp_arr| {
-        const grp_items = grp_arr.array.items;
+    if (try optionalField(seg_obj, "group", .array)) |grp_arr| {
+        const grp_items = grp_arr.items;
         const grp = try allocator.alloc([]const u8, grp_items.len);
+        errdefer allocator.free(grp);
         for (grp_items, 0..) |item, i| {
-            grp[i] = item.string;
+            grp[i] = try expectKind(item, .string);
         }
         group = grp;
     }
 
     // Parse elements (optional)
     var elements: []ElementMapping = &[_]ElementMapping{};
-    if (seg_obj.get("elements")) |elem_arr| {
-        const elements_json = elem_arr.array.items;
+    if (try optionalField(seg_obj, "elements", .array)) |elem_arr| {
+        const elements_json = elem_arr.items;
         const elems = try allocator.alloc(ElementMapping, elements_json.len);
         errdefer allocator.free(elems);
 
         for (elements_json, 0..) |elem_value, i| {
-            const elem_obj = elem_value.object;
+            const elem_obj = try expectKind(elem_value, .object);
             elems[i] = try parseElement(allocator, elem_obj);
         }
         elements = elems;
@@ -679,8 +720,8 @@ fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, defin
 
     // Parse repeating_elements (optional)
     var repeating_elements: ?RepeatingElements = null;
-    if (seg_obj.get("repeating_elements")) |rep_obj| {
-        repeating_elements = try parseRepeatingElements(allocator, rep_obj.object);
+    if (try optionalField(seg_obj, "repeating_elements", .object)) |rep_obj| {
+        repeating_elements = try parseRepeatingElements(allocator, rep_obj);
     }
 
     return SegmentDef{
@@ -697,44 +738,47 @@ fn parseSegment(allocator: std.mem.Allocator, seg_obj: std.json.ObjectMap, defin
 
 /// Parse element mapping from JSON
 fn parseElement(allocator: std.mem.Allocator, elem_obj: std.json.ObjectMap) !ElementMapping {
-    const seg = if (elem_obj.get("seg")) |s| s.string else null;
-    const pos = switch (elem_obj.get("pos").?) {
-        .integer => |i| @as(usize, @intCast(i)),
+    const seg = try optionalField(elem_obj, "seg", .string);
+    const pos = switch (elem_obj.get("pos") orelse return error.InvalidSchema) {
+        .integer => |i| std.math.cast(usize, i) orelse return error.InvalidSchema,
         else => 0,
     };
-    const path = if (elem_obj.get("path") != null) elem_obj.get("path").?.string else "";
-    const expect = if (elem_obj.get("expect")) |e| e.string else null;
-    const optional = if (elem_obj.get("optional")) |o| o.bool else false;
+    const path = (try optionalField(elem_obj, "path", .string)) orelse "";
+    const expect = try optionalField(elem_obj, "expect", .string);
+    const optional = (try optionalField(elem_obj, "optional", .bool)) orelse false;
 
     // Parse value mapping
     var map: ?std.StringHashMap([]const u8) = null;
-    if (elem_obj.get("map")) |map_obj| {
+    if (try optionalField(elem_obj, "map", .object)) |map_obj| {
         var hash_map = std.StringHashMap([]const u8).init(allocator);
-        var map_iter = map_obj.object.iterator();
+        errdefer hash_map.deinit();
+        var map_iter = map_obj.iterator();
         while (map_iter.next()) |entry| {
-            try hash_map.put(entry.key_ptr.*, entry.value_ptr.*.string);
+            try hash_map.put(entry.key_ptr.*, try expectKind(entry.value_ptr.*, .string));
         }
         map = hash_map;
     }
 
     // Parse transforms
     var transform: ?[]const []const u8 = null;
-    if (elem_obj.get("transform")) |trans_arr| {
-        const trans_items = trans_arr.array.items;
+    if (try optionalField(elem_obj, "transform", .array)) |trans_arr| {
+        const trans_items = trans_arr.items;
         const trans = try allocator.alloc([]const u8, trans_items.len);
+        errdefer allocator.free(trans);
         for (trans_items, 0..) |item, i| {
-            trans[i] = item.string;
+            trans[i] = try expectKind(item, .string);
         }
         transform = trans;
     }
 
     // Parse composite sub-component indices
     var composite: ?[]usize = null;
-    if (elem_obj.get("composite")) |comp_arr| {
-        const comp_items = comp_arr.array.items;
+    if (try optionalField(elem_obj, "composite", .array)) |comp_arr| {
+        const comp_items = comp_arr.items;
         const comp = try allocator.alloc(usize, comp_items.len);
+        errdefer allocator.free(comp);
         for (comp_items, 0..) |item, i| {
-            comp[i] = @intCast(item.integer);
+            comp[i] = try expectIndex(item);
         }
         composite = comp;
     }
@@ -754,15 +798,15 @@ fn parseElement(allocator: std.mem.Allocator, elem_obj: std.json.ObjectMap) !Ele
 
 /// Parse repeating elements configuration from JSON
 fn parseRepeatingElements(allocator: std.mem.Allocator, rep_obj: std.json.ObjectMap) !RepeatingElements {
-    const all = if (rep_obj.get("all")) |a| a.bool else false;
-    const separator = rep_obj.get("separator").?.string;
-    const patterns_json = rep_obj.get("patterns").?.array.items;
+    const all = (try optionalField(rep_obj, "all", .bool)) orelse false;
+    const separator = try requireField(rep_obj, "separator", .string);
+    const patterns_json = (try requireField(rep_obj, "patterns", .array)).items;
 
     const patterns = try allocator.alloc(RepeatingElementPattern, patterns_json.len);
     errdefer allocator.free(patterns);
 
     for (patterns_json, 0..) |pattern_value, i| {
-        patterns[i] = try parseRepeatingElementPattern(allocator, pattern_value.object);
+        patterns[i] = try parseRepeatingElementPattern(allocator, try expectKind(pattern_value, .object));
     }
 
     return RepeatingElements{
@@ -775,27 +819,27 @@ fn parseRepeatingElements(allocator: std.mem.Allocator, rep_obj: std.json.Object
 
 /// Parse repeating element pattern from JSON
 fn parseRepeatingElementPattern(allocator: std.mem.Allocator, pattern_obj: std.json.ObjectMap) !RepeatingElementPattern {
-    const when_qualifier_json = pattern_obj.get("when_qualifier").?.array.items;
-    const output_array = pattern_obj.get("output_array").?.string;
-    const fields_json = pattern_obj.get("fields").?.array.items;
+    const when_qualifier_json = (try requireField(pattern_obj, "when_qualifier", .array)).items;
+    const output_array = try requireField(pattern_obj, "output_array", .string);
+    const fields_json = (try requireField(pattern_obj, "fields", .array)).items;
 
     // Parse qualifiers
     const when_qualifier = try allocator.alloc([]const u8, when_qualifier_json.len);
     errdefer allocator.free(when_qualifier);
     for (when_qualifier_json, 0..) |qual_value, i| {
-        when_qualifier[i] = try allocator.dupe(u8, qual_value.string);
+        when_qualifier[i] = try allocator.dupe(u8, try expectKind(qual_value, .string));
     }
 
     // Parse fields
     const fields = try allocator.alloc(RepeatingElementField, fields_json.len);
     errdefer allocator.free(fields);
     for (fields_json, 0..) |field_value, i| {
-        const field_obj = field_value.object;
-        const component = switch (field_obj.get("component").?) {
-            .integer => |comp| @as(usize, @intCast(comp)),
+        const field_obj = try expectKind(field_value, .object);
+        const component = switch (field_obj.get("component") orelse return error.InvalidSchema) {
+            .integer => |comp| std.math.cast(usize, comp) orelse return error.InvalidSchema,
             else => 0,
         };
-        const name = field_obj.get("name").?.string;
+        const name = try requireField(field_obj, "name", .string);
 
         fields[i] = RepeatingElementField{
             .component = component,
@@ -1001,6 +1045,46 @@ test "load 837P schema" {
     try testing.expect(schema.trailer_segments.len > 0);
 }
 
+test "load schema from memory" {
+    const allocator = testing.allocator;
+
+    const json = try allocator.dupe(u8,
+        \\{"schema_version": "2.0",
+        \\ "transaction": {"id": "TEST", "version": "005010", "type": "837", "description": "Test"},
+        \\ "transaction_header": {"segments": []},
+        \\ "hierarchical_structure": {"output_array": "items", "levels": {}},
+        \\ "transaction_trailer": {"segments": []}}
+    );
+
+    var schema = try loadSchemaFromSlice(allocator, json);
+    defer schema.deinit();
+
+    // The schema keeps its own copy of the JSON
+    allocator.free(json);
+
+    try testing.expectEqualStrings("TEST", schema.transaction_id);
+    try testing.expectEqualStrings("items", schema.hierarchical_output_array);
+    try testing.expectEqual(@as(usize, 0), schema.header_segments.len);
+}
+
+test "reject malformed schema JSON" {
+    const allocator = testing.allocator;
+
+    try testing.expectError(error.InvalidSchema, loadSchemaFromSlice(allocator, "{}"));
+    try testing.expectError(error.InvalidSchema, loadSchemaFromSlice(allocator, "[]"));
+    try testing.expectError(error.InvalidSchema, loadSchemaFromSlice(allocator, "not json"));
+    try testing.expectError(error.InvalidSchema, loadSchemaFromSlice(allocator,
+        \\{"schema_version": "2.0", "transaction": 1}
+    ));
+    try testing.expectError(error.InvalidSchema, loadSchemaFromSlice(allocator,
+        \\{"schema_version": "2.0",
+        \\ "transaction": {"id": "TEST", "version": "005010", "type": "837", "description": "Test"},
+        \\ "transaction_header": {"segments": [{"optional": true}]},
+        \\ "hierarchical_structure": {"output_array": "items", "levels": {}},
+        \\ "transaction_trailer": {"segments": []}}
+    ));
+}
+
 test "get HL level from schema" {
     const allocator = testing.allocator;
 
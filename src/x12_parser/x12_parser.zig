@@ -175,15 +175,18 @@ pub const X12Document = struct {
 /// Parse X12 document from raw text
 pub fn parse(allocator: std.mem.Allocator, content: []const u8) !X12Document {
     // Step 1: Remove newlines and carriage returns from content
-    // X12 files may have newlines added for readability, but they're not part of the standard
-    var cleaned_content = try std.ArrayList(u8).initCapacity(allocator, 1);
+    // X12 files may have newlines added for readability, but they're not part of the standard.
+    // The cleaned data is never longer than the input, so reserve it once and copy the
+    // runs between line breaks in bulk instead of appending byte by byte.
+    var cleaned_content = try std.ArrayList(u8).initCapacity(allocator, content.len);
     defer cleaned_content.deinit(allocator);
 
-    for (content) |c| {
-        if (c != '\n' and c != '\r') {
-            try cleaned_content.append(allocator, c);
-        }
+    var run_start: usize = 0;
+    while (std.mem.indexOfAnyPos(u8, content, run_start, "\r\n")) |line_break| {
+        cleaned_content.appendSliceAssumeCapacity(content[run_start..line_break]);
+        run_start = line_break + 1;
     }
+    cleaned_content.appendSliceAssumeCapacity(content[run_start..]);
 
     const clean_data = try cleaned_content.toOwnedSlice(allocator);
     errdefer allocator.free(clean_data);
@@ -340,6 +343,23 @@ test "parse simple X12 document" {
     try testing.expectEqualStrings("BHT", doc.segments[3].id);
 }
 
+test "parse document with CRLF line breaks inside segments" {
+    const allocator = testing.allocator;
+
+    const x12_content = "ISA*00*          *00*          *ZZ*SUBMITTER      *ZZ*RECEIVER       *210101*1200*^*00501*000000001*0*P*:~\r\n" ++
+        "GS*HC*SENDER*RECEIVER*20210101*1200*1*X*005010X222A1~\r\n" ++
+        "ST*837*0001*005010X222A1~BHT*0019*00*BATCH\r\n123*20210101*1200*CH~\n" ++
+        "SE*4*0001~GE*1*1~IEA*1*000000001~\r\n";
+
+    var doc = try parse(allocator, x12_content);
+    defer doc.deinit();
+
+    try testing.expectEqual(@as(usize, 7), doc.segments.len);
+    try testing.expectEqualStrings("GS", doc.segments[1].id);
+    try testing.expectEqualStrings("BATCH123", doc.segments[3].elements[3]);
+    try testing.expectEqualStrings("IEA", doc.segments[6].id);
+}
+
 test "segment getElement method" {
     const allocator = testing.allocator;
     const delimiters = Delimiters{